@@ -5,10 +5,12 @@ This script demonstrates basic usage for Whoop, Withings, OneDrive, Hevy, and Ou
 using the restored implementation with service abstraction.
 """
 
+import asyncio
 import sys
 import os
-from datetime import datetime, timedelta, date
+from datetime import timedelta, date
 import json
+from functools import lru_cache
 
 # Import the services from the local_healthkit package
 from local_healthkit import (
@@ -16,19 +18,47 @@ from local_healthkit import (
     HevyService, OuraService
 )
 
+# Service class per name, for get_service
+SERVICE_CLASSES = {
+    "whoop": WhoopService,
+    "withings": WithingsService,
+    "onedrive": OneDriveService,
+    "hevy": HevyService,
+    "oura": OuraService,
+}
 
-def test_whoop_service():
+
+@lru_cache(maxsize=None)
+def get_service(name):
+    """Return the service for a name, constructing it once per process.
+    
+    The status checks and the service examples share these instances, so
+    credentials and stored tokens are loaded once per service.
+    """
+    return SERVICE_CLASSES[name]()
+
+
+# Days of history each example fetches, counted back from one shared end date
+LOOKBACK_DAYS = {"whoop": 3, "withings": 7, "hevy": 30, "oura": 7}
+
+
+def date_range(service_name, end_date=None):
+    """Return (start_date, end_date) for a service's lookback window."""
+    end_date = end_date or date.today()
+    return end_date - timedelta(days=LOOKBACK_DAYS[service_name]), end_date
+
+
+def test_whoop_service(end_date=None):
     """Test the Whoop service with basic data retrieval."""
     print("🏃 Testing Whoop Service")
     print("-" * 30)
     
     try:
         # Initialize service (reads WHOOP_CLIENT_ID and WHOOP_CLIENT_SECRET from environment)
-        service = WhoopService()
+        service = get_service("whoop")
         
         # Get data for the last 3 days
-        end_date = date.today()
-        start_date = end_date - timedelta(days=3)
+        start_date, end_date = date_range("whoop", end_date)
         
         print(f"📅 Fetching data from {start_date} to {end_date}")
         
@@ -48,14 +78,14 @@ def test_whoop_service():
         print(f"❌ Whoop client failed: {e}")
         return False
 
-def test_withings_service():
+def test_withings_service(end_date=None):
     """Test the Withings service with authentication."""
     print("⚖️ Testing Withings Service")
     print("-" * 30)
     
     try:
         # Initialize service (reads WITHINGS_CLIENT_ID and WITHINGS_CLIENT_SECRET from environment)
-        service = WithingsService()
+        service = get_service("withings")
         client = service.withings_client
         
         print(f"✅ Service created successfully")
@@ -71,8 +101,7 @@ def test_withings_service():
             print("ℹ️  Not authenticated - triggering OAuth2 flow...")
         
         # Try to fetch data - this will trigger authentication if needed
-        end_date = date.today()
-        start_date = end_date - timedelta(days=7)
+        start_date, end_date = date_range("withings", end_date)
         
         print(f"📅 Fetching weight data from {start_date} to {end_date}")
         print("ℹ️  This will trigger OAuth2 authentication if needed...")
@@ -98,7 +127,7 @@ def test_onedrive_service():
     
     try:
         # Initialize service (reads ONEDRIVE_CLIENT_ID from environment)
-        service = OneDriveService()
+        service = get_service("onedrive")
         client = service.onedrive_client
         
         print(f"📋 Testing OneDrive connectivity...")
@@ -134,14 +163,14 @@ def test_onedrive_service():
         print(f"❌ OneDrive service failed: {e}")
         return False
 
-def test_hevy_service():
+def test_hevy_service(end_date=None):
     """Test the Hevy service with basic data retrieval."""
     print("🏋️ Testing Hevy Service")
     print("-" * 30)
     
     try:
         # Initialize service (reads HEVY_API_KEY from environment)
-        service = HevyService()
+        service = get_service("hevy")
         print(f"✅ Service created: {service.get_service_info()}")
         
         # Check authentication
@@ -152,8 +181,7 @@ def test_hevy_service():
             return False
         
         # Get recent workouts
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)  # Last 30 days
+        start_date, end_date = date_range("hevy", end_date)
         
         print(f"📅 Fetching workouts from {start_date} to {end_date}")
         
@@ -181,14 +209,14 @@ def test_hevy_service():
             pass
         return False
 
-def test_oura_service():
+def test_oura_service(end_date=None):
     """Test the Oura service with basic data retrieval."""
     print("💍 Testing Oura Service")
     print("-" * 30)
     
     try:
         # Initialize service (reads OURA_API_KEY from environment)
-        service = OuraService()
+        service = get_service("oura")
         print(f"✅ Service created: {service.get_service_info()}")
         
         # Check authentication
@@ -199,8 +227,7 @@ def test_oura_service():
             return False
         
         # Get recent activity data
-        end_date = date.today()
-        start_date = end_date - timedelta(days=7)  # Last 7 days
+        start_date, end_date = date_range("oura", end_date)
         
         print(f"📅 Fetching data from {start_date} to {end_date}")
         
@@ -238,76 +265,97 @@ def test_oura_service():
             pass
         return False
 
-def check_authentication_status():
-    """Check the authentication status of all clients."""
-    print("🔐 Authentication Status")
-    print("-" * 30)
-    
-    # Check Whoop
+def _whoop_status():
+    """Return the Whoop authentication status lines."""
     try:
-        whoop = WhoopService()
+        whoop = get_service("whoop")
         whoop_auth = whoop.is_authenticated()
         
-        print(f"Whoop:")
-        print(f"   Authenticated: {'✅ Yes' if whoop_auth else '❌ No'}")
+        return [
+            f"Whoop:",
+            f"   Authenticated: {'✅ Yes' if whoop_auth else '❌ No'}",
+        ]
         
     except Exception as e:
-        print(f"Whoop status check failed: {e}")
-    
-    # Check Withings
+        return [f"Whoop status check failed: {e}"]
+
+def _withings_status():
+    """Return the Withings authentication status lines."""
     try:
-        withings = WithingsService()
+        withings = get_service("withings")
         withings_auth = withings.is_authenticated()
         withings_sliding = withings.withings_client.is_in_sliding_window() if hasattr(withings.withings_client, 'is_in_sliding_window') else False
         
-        print(f"Withings:")
-        print(f"   Authenticated: {'✅ Yes' if withings_auth else '❌ No'}")
-        print(f"   In sliding window: {'✅ Yes' if withings_sliding else '❌ No'}")
+        lines = [
+            f"Withings:",
+            f"   Authenticated: {'✅ Yes' if withings_auth else '❌ No'}",
+            f"   In sliding window: {'✅ Yes' if withings_sliding else '❌ No'}",
+        ]
         if withings_sliding:
-            print(f"   Days remaining: ~89 days")
+            lines.append(f"   Days remaining: ~89 days")
+        return lines
         
     except Exception as e:
-        print(f"Withings status check failed: {e}")
-    
-    # Check OneDrive
+        return [f"Withings status check failed: {e}"]
+
+def _onedrive_status():
+    """Return the OneDrive authentication status lines."""
     try:
-        onedrive = OneDriveService()
+        onedrive = get_service("onedrive")
         onedrive_auth = onedrive.is_authenticated()
         
-        print(f"OneDrive:")
-        print(f"   Authenticated: {'✅ Yes' if onedrive_auth else '❌ No'}")
-        print(f"   In sliding window: {'✅ Yes' if onedrive_auth else '❌ No'}")
+        lines = [
+            f"OneDrive:",
+            f"   Authenticated: {'✅ Yes' if onedrive_auth else '❌ No'}",
+            f"   In sliding window: {'✅ Yes' if onedrive_auth else '❌ No'}",
+        ]
         if onedrive_auth:
-            print(f"   Days remaining: ~89 days")
-        
-    except Exception as e:
-        print(f"OneDrive status check failed: {e}")
-    
-    # Check Hevy
-    try:
-        hevy = HevyService()
-        hevy_auth = hevy.is_authenticated()
-        
-        print(f"Hevy:")
-        print(f"   Authenticated: {'✅ Yes' if hevy_auth else '❌ No'}")
-        print(f"   Type: API key authentication")
-        print(f"   No tokens: Simple API key, no persistence needed")
+            lines.append(f"   Days remaining: ~89 days")
+        return lines
         
     except Exception as e:
-        print(f"Hevy status check failed: {e}")
+        return [f"OneDrive status check failed: {e}"]
 
-    # Check Oura
+def _api_key_status(name, service_name):
+    """Return the authentication status lines for an API key service."""
     try:
-        oura = OuraService()
-        oura_auth = oura.is_authenticated()
+        service = get_service(service_name)
+        is_auth = service.is_authenticated()
         
-        print(f"Oura:")
-        print(f"   Authenticated: {'✅ Yes' if oura_auth else '❌ No'}")
-        print(f"   Type: API key authentication")
-        print(f"   No tokens: Simple API key, no persistence needed")
+        return [
+            f"{name}:",
+            f"   Authenticated: {'✅ Yes' if is_auth else '❌ No'}",
+            f"   Type: API key authentication",
+            f"   No tokens: Simple API key, no persistence needed",
+        ]
         
     except Exception as e:
-        print(f"Oura status check failed: {e}")
+        return [f"{name} status check failed: {e}"]
+
+# Status checks in display order; each loads tokens or keys and may refresh
+# them over the network, so they run concurrently
+AUTH_STATUS_CHECKS = [
+    (_whoop_status, ()),
+    (_withings_status, ()),
+    (_onedrive_status, ()),
+    (_api_key_status, ("Hevy", "hevy")),
+    (_api_key_status, ("Oura", "oura")),
+]
+
+async def _gather_authentication_status():
+    """Run every status check in a worker thread and collect their lines."""
+    return await asyncio.gather(
+        *(asyncio.to_thread(check, *args) for check, args in AUTH_STATUS_CHECKS)
+    )
+
+def check_authentication_status():
+    """Check the authentication status of all clients."""
+    print("🔐 Authentication Status")
+    print("-" * 30)
+    
+    # Print after all checks finish so each service's lines stay together
+    for lines in asyncio.run(_gather_authentication_status()):
+        print("\n".join(lines))
 
 def main():
     """Main function to run all tests."""
@@ -319,20 +367,22 @@ def main():
     check_authentication_status()
     print()
     
-    # Test all services
-    whoop_success = test_whoop_service()
+    # Test all services against the same end date so the ranges line up.
+    # These run one at a time: each may start an interactive OAuth flow.
+    today = date.today()
+    whoop_success = test_whoop_service(today)
     print()
     
-    withings_success = test_withings_service()
+    withings_success = test_withings_service(today)
     print()
     
     onedrive_success = test_onedrive_service()
     print()
     
-    hevy_success = test_hevy_service()
+    hevy_success = test_hevy_service(today)
     print()
     
-    oura_success = test_oura_service()
+    oura_success = test_oura_service(today)
     print()
     
     # Summary
@@ -15,24 +15,10 @@ Features:
 - Production-ready architecture with comprehensive logging
 """
 
-from .clients import (
-    OuraClient,
-    HevyClient,
-    WhoopClient,
-    WithingsClient,
-    OneDriveClient,
-    NutritionClient,
-)
-
-from .services import (
-    OuraService,
-    HevyService,
-    WhoopService,
-    WithingsService,
-    OneDriveService,
-    NutritionService,
-)
+import os
+from typing import TYPE_CHECKING
 
+from ._lazy import make_lazy_getattr
 from .exceptions import (
     LocalHealthKitError,
     APIClientError,
@@ -40,6 +26,43 @@ from .exceptions import (
     RateLimitError,
 )
 
+# Clients and services are imported on first attribute access (PEP 562), so
+# using one provider does not pay the import cost of msal, authlib, etc.
+_LAZY_IMPORTS = {
+    # Clients
+    "OuraClient": ".clients.oura",
+    "HevyClient": ".clients.hevy",
+    "WhoopClient": ".clients.whoop",
+    "WithingsClient": ".clients.withings",
+    "OneDriveClient": ".clients.onedrive",
+    "NutritionClient": ".clients.nutrition",
+    # Services
+    "OuraService": ".services.oura",
+    "HevyService": ".services.hevy",
+    "WhoopService": ".services.whoop",
+    "WithingsService": ".services.withings",
+    "OneDriveService": ".services.onedrive",
+    "NutritionService": ".services.nutrition",
+}
+
+if TYPE_CHECKING:
+    from .clients.oura import OuraClient
+    from .clients.hevy import HevyClient
+    from .clients.whoop import WhoopClient
+    from .clients.withings import WithingsClient
+    from .clients.onedrive import OneDriveClient
+    from .clients.nutrition import NutritionClient
+    from .services.oura import OuraService
+    from .services.hevy import HevyService
+    from .services.whoop import WhoopService
+    from .services.withings import WithingsService
+    from .services.onedrive import OneDriveService
+    from .services.nutrition import NutritionService
+
+
+__getattr__, __dir__ = make_lazy_getattr(__name__, globals(), _LAZY_IMPORTS)
+
+
 __version__ = "2.0.0"
 __author__ = "Thomas Newton"
 __email__ = "thomas.newton@example.com"
@@ -67,3 +90,10 @@ __all__ = [
     # Metadata
     "__version__",
 ]
+
+# HEALTH_EAGER_IMPORT=1 resolves every lazy import up front, so CI surfaces
+# broken or missing dependencies at import time instead of first use
+if os.getenv("HEALTH_EAGER_IMPORT") == "1":
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,35 @@
+"""Lazy attribute imports (PEP 562) shared by the package ``__init__`` modules."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def make_lazy_getattr(
+    package: str, namespace: Dict[str, Any], lazy_imports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build a package's module-level ``__getattr__`` and ``__dir__``.
+
+    Each name in ``lazy_imports`` is imported from its module on first
+    attribute access and stored in ``namespace``, so later lookups skip
+    ``__getattr__`` entirely.
+
+    Args:
+        package: The package's ``__name__``; relative module names resolve against it
+        namespace: The package's ``globals()``
+        lazy_imports: Attribute name to (relative) module name it lives in
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at the package's module level
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value  # Cache so later lookups skip __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(lazy_imports))
+
+    return __getattr__, __dir__
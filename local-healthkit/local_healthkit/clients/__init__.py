@@ -15,12 +15,28 @@ Features:
 - Production-ready authentication flows
 """
 
-from .oura import OuraClient
-from .hevy import HevyClient
-from .whoop import WhoopClient
-from .withings import WithingsClient
-from .onedrive import OneDriveClient
-from .nutrition import NutritionClient
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy_getattr
+
+# Clients are imported on first attribute access (PEP 562), so e.g. using
+# HevyClient does not import msal for OneDrive
+_LAZY_IMPORTS = {
+    "OuraClient": ".oura",
+    "HevyClient": ".hevy",
+    "WhoopClient": ".whoop",
+    "WithingsClient": ".withings",
+    "OneDriveClient": ".onedrive",
+    "NutritionClient": ".nutrition",
+}
+
+if TYPE_CHECKING:
+    from .oura import OuraClient
+    from .hevy import HevyClient
+    from .whoop import WhoopClient
+    from .withings import WithingsClient
+    from .onedrive import OneDriveClient
+    from .nutrition import NutritionClient
 
 __all__ = [
     "OuraClient",
@@ -30,3 +46,6 @@ __all__ = [
     "OneDriveClient",
     "NutritionClient",
 ]
+
+
+__getattr__, __dir__ = make_lazy_getattr(__name__, globals(), _LAZY_IMPORTS)
@@ -12,7 +12,9 @@ from typing import Any, Dict, Optional
 import requests
 
 from .config import ClientFactory
-from ...exceptions import APIClientError, AuthenticationError
+from .http import get_shared_session
+from .rate_limit import RETRYABLE_STATUS_CODES, TokenBucket, backoff_delay
+from ...exceptions import APIClientError, AuthenticationError, RateLimitError
 
 
 class APIKeyAuthBase:
@@ -25,6 +27,7 @@ class APIKeyAuthBase:
     Key features:
     - Simple API key authentication from environment variables
     - Retry logic with exponential backoff
+    - Adaptive rate limiting that honors Retry-After on 429
     - Consistent error handling
     - Configurable authentication headers
     - No token persistence (stateless)
@@ -63,6 +66,13 @@ class APIKeyAuthBase:
         self.max_retries = max_retries
         self.config = ClientFactory.get_client_config()
         self.env_api_key = env_api_key  # Store for debugging
+        
+        # Shared pooled session: the API key travels in per-request headers,
+        # so every client instance can reuse the same keep-alive connections
+        self.session = get_shared_session()
+        
+        # Adaptive pacing shared by every request from this client
+        self.rate_limiter = TokenBucket()
     
     def is_authenticated(self) -> bool:
         """Check if client is authenticated (has valid API key).
@@ -101,23 +111,42 @@ class APIKeyAuthBase:
         request_headers = headers or {}
         request_headers.update(self._get_auth_headers())
         
-        # Retry logic with exponential backoff
+        # Retry logic with jittered exponential backoff (config.retry_delays)
         for attempt in range(self.max_retries + 1):
             try:
-                response = requests.request(
+                self.rate_limiter.acquire()
+                response = self.session.request(
                     method=method,
                     url=url,
                     params=params,
                     headers=request_headers,
                     **kwargs
                 )
+                
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    # Slow down on throttling and honor the server's Retry-After
+                    if response.status_code == 429:
+                        self.rate_limiter.on_throttle()
+                    wait_time = backoff_delay(attempt, self.config.retry_delays, response)
+                    if attempt < self.max_retries:
+                        print(f"⚠️  HTTP {response.status_code} (attempt {attempt + 1}), retrying in {wait_time:.1f} seconds...")
+                        time.sleep(wait_time)
+                        continue
+                if response.status_code == 429:
+                    raise RateLimitError(
+                        f"API rate limit exceeded after {self.max_retries} retries",
+                        retry_after=int(wait_time),
+                        status_code=429,
+                    )
+                
                 response.raise_for_status()
+                self.rate_limiter.on_success()
                 return response
                 
             except requests.exceptions.RequestException as e:
                 if attempt < self.max_retries:
-                    wait_time = 2**attempt  # Exponential backoff: 1, 2, 4 seconds
-                    print(f"⚠️  Request failed (attempt {attempt + 1}), retrying in {wait_time} seconds...")
+                    wait_time = backoff_delay(attempt, self.config.retry_delays)
+                    print(f"⚠️  Request failed (attempt {attempt + 1}), retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -0,0 +1,96 @@
+"""Shared HTTP session setup for API clients."""
+
+import atexit
+import threading
+from typing import Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def connection_retry(total: int = 3, backoff_factor: float = 0.5) -> Retry:
+    """Build a retry policy that only retries failed connection attempts.
+
+    Connection errors happen before the request is sent, so retrying them is
+    safe for any method. Status codes (including 429) are left to the
+    clients' own retry and rate-limit handling.
+
+    Args:
+        total: Maximum number of connection retries
+        backoff_factor: Exponential backoff factor between attempts
+
+    Returns:
+        Retry policy for an HTTPAdapter
+    """
+    return Retry(
+        total=total,
+        connect=total,
+        read=0,
+        status=0,
+        redirect=0,
+        backoff_factor=backoff_factor,
+        raise_on_status=False,
+    )
+
+
+def configure_session(
+    session: requests.Session,
+    pool_connections: int = 10,
+    pool_maxsize: int = 20,
+    max_retries: Optional[Union[int, Retry]] = None,
+) -> requests.Session:
+    """Mount a pooled adapter so connections are kept alive across requests.
+
+    Reusing one session per client amortizes the TCP/TLS handshake over every
+    page and token request instead of paying it per call. The pool is sized
+    for the concurrent page and endpoint fetches done by clients and services.
+
+    Args:
+        session: Session to configure (plain or OAuth2Session)
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host
+        max_retries: Transport-level retries for the adapter (defaults to
+            connection_retry()); pass 0 when the client's own request loop
+            already retries network errors, so failures are not retried at
+            two levels
+
+    Returns:
+        The configured session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=connection_retry() if max_retries is None else max_retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use.
+
+    For clients whose session holds no per-client auth state (credentials
+    are sent as per-request headers). Sharing it means a new client
+    instance reuses the keep-alive connections opened by earlier instances
+    instead of paying a fresh TCP/TLS handshake. Its adapter does not retry:
+    the API-key clients using it retry connection errors in make_request.
+
+    Returns:
+        Shared session, closed automatically at interpreter exit
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = configure_session(
+                    requests.Session(), pool_connections=20, pool_maxsize=20, max_retries=0
+                )
+                atexit.register(session.close)
+                _shared_session = session
+    return _shared_session
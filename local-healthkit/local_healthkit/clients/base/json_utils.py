@@ -0,0 +1,66 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install local-healthkit[fast]``). When it
+is not available the stdlib ``json`` module is used, so callers never need to
+care which parser is active.
+"""
+
+import json
+from typing import Any, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str.
+
+    Args:
+        data: Raw JSON payload (e.g. ``response.content``)
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a response body once and cache the result on the response.
+
+    Error strategies and callers often inspect the same response; caching
+    avoids re-decoding the body each time.
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        Parsed JSON payload
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    try:
+        return response._parsed_json
+    except AttributeError:
+        response._parsed_json = loads(response.content)
+        return response._parsed_json
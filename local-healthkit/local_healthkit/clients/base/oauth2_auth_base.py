@@ -1,8 +1,11 @@
 """Base OAuth2 client using authlib for authentication."""
 
-import json
+import functools
 import os
 import socket
+import tempfile
+import threading
+import time
 import webbrowser
 from datetime import datetime, timedelta
 from http.server import BaseHTTPRequestHandler, HTTPServer
@@ -24,6 +27,89 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 from dataclasses import dataclass
 from .config import ClientConfig, CLIENT_CONFIG
+from .http import configure_session
+from .rate_limit import RETRYABLE_STATUS_CODES, TokenBucket, backoff_delay
+from .json_utils import dumps, loads, response_json
+
+
+@functools.lru_cache(maxsize=8)
+def _read_token_file(path: str, mtime_ns: int) -> dict:
+    """Parse a token file; cached per (path, mtime) so unchanged files are read once."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def load_token_file(path: str) -> Optional[dict]:
+    """Load a token file, reusing the parsed contents while its mtime is unchanged.
+
+    Args:
+        path: Absolute path to the token file
+
+    Returns:
+        A fresh copy of the token dictionary, or None if the file doesn't exist
+
+    Raises:
+        ValueError: If the file does not contain valid JSON
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return dict(_read_token_file(path, mtime_ns))
+
+
+def write_token_file(path: str, token_data: dict) -> None:
+    """Atomically write a token file.
+
+    The token is written to a uniquely named sibling temp file, synced to
+    disk and moved into place with os.replace, so a crash mid-write never
+    leaves a truncated token behind and concurrent writers never share a
+    temp file.
+
+    Args:
+        path: Absolute path to the token file
+        token_data: Token dictionary to persist
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(dumps(token_data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _ttl_cache(seconds: float = 1.0):
+    """Cache a zero-argument method's result per instance for a short TTL.
+
+    Token state only changes on load/save/refresh, which call
+    ``_invalidate_auth_cache``, so repeated checks inside a burst of paginated
+    requests can reuse the previous answer.
+
+    Args:
+        seconds: How long a cached result stays valid
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            cache = self.__dict__.setdefault('_auth_cache', {})
+            now = time.monotonic()
+            cached = cache.get(method.__name__)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            result = method(self)
+            cache[method.__name__] = (now + seconds, result)
+            return result
+        return wrapper
+    return decorator
 
 
 class TokenFileManager:
@@ -44,12 +130,8 @@ class TokenFileManager:
         Returns:
             Token data dictionary or None if file doesn't exist
         """
-        if not os.path.exists(self.token_file):
-            return None
-            
         try:
-            with open(self.token_file, 'r') as f:
-                return json.load(f)
+            return load_token_file(self.token_file)
         except Exception as e:
             print(f"Warning: Failed to load {self.service_name} token: {e}")
             return None
@@ -78,8 +160,7 @@ class TokenFileManager:
             if extra_data:
                 final_token.update(extra_data)
             
-            with open(self.token_file, 'w') as f:
-                json.dump(final_token, f, indent=2)
+            write_token_file(self.token_file, final_token)
                 
         except Exception as e:
             print(f"Warning: Failed to save {self.service_name} token: {e}")
@@ -109,8 +190,8 @@ class SlidingWindowValidator:
         if not token_data or "sliding_window_expires_at" not in token_data:
             return False
             
-        sliding_expires = datetime.fromtimestamp(token_data["sliding_window_expires_at"])
-        return datetime.now() < sliding_expires
+        # Compare epoch floats directly; no datetime objects per check
+        return time.time() < token_data["sliding_window_expires_at"]
     
     @staticmethod
     def should_refresh_proactively(token_data: dict, buffer_hours: int) -> bool:
@@ -126,10 +207,7 @@ class SlidingWindowValidator:
         if not token_data or "expires_at" not in token_data:
             return False
             
-        expires_at = datetime.fromtimestamp(token_data["expires_at"])
-        buffer_time = datetime.now() + timedelta(hours=buffer_hours)
-        
-        return buffer_time >= expires_at
+        return time.time() + buffer_hours * 3600 >= token_data["expires_at"]
     
     @staticmethod
     def get_days_remaining(token_data: dict) -> int:
@@ -144,10 +222,9 @@ class SlidingWindowValidator:
         if not token_data or "sliding_window_expires_at" not in token_data:
             return 0
             
-        sliding_expires = datetime.fromtimestamp(token_data["sliding_window_expires_at"])
-        remaining = sliding_expires - datetime.now()
+        remaining = token_data["sliding_window_expires_at"] - time.time()
         
-        return max(0, remaining.days)
+        return max(0, int(remaining // 86400))
 
 
 class ErrorHandlingStrategy:
@@ -196,7 +273,8 @@ class StandardHttpErrorStrategy(ErrorHandlingStrategy):
                 return True
         
         # Check if it's an HTTPError with response
-        if hasattr(error, 'response') and error.response:
+        # Compare with None: a Response is falsy for 4xx/5xx statuses
+        if getattr(error, 'response', None) is not None:
             try:
                 status_code = error.response.status_code
                 if status_code in [401, 403]:
@@ -204,8 +282,8 @@ class StandardHttpErrorStrategy(ErrorHandlingStrategy):
                     
                 # Try to get response JSON for API-specific errors
                 try:
-                    response_json = error.response.json()
-                    error_msg = str(response_json.get("error", "")).lower()
+                    data = response_json(error.response)
+                    error_msg = str(data.get("error", "")).lower()
                     if "invalid_token" in error_msg or "expired" in error_msg or "unauthorized" in error_msg:
                         return True
                 except:
@@ -229,7 +307,7 @@ class WithingsErrorStrategy(ErrorHandlingStrategy):
         # This handles both error exceptions and successful HTTP responses with status != 0
         if response:
             try:
-                data = response.json()
+                data = response_json(response)
                 if data.get("status") != 0:
                     error_msg = str(data.get("error", "")).lower()
                     if "invalid_token" in error_msg or "expired" in error_msg:
@@ -243,7 +321,7 @@ class WithingsErrorStrategy(ErrorHandlingStrategy):
         """Extract error message from Withings response format."""
         if response:
             try:
-                data = response.json()
+                data = response_json(response)
                 if data.get("status") != 0:
                     return data.get("error", str(error))
             except:
@@ -262,7 +340,7 @@ class WithingsErrorStrategy(ErrorHandlingStrategy):
             Exception: If response contains Withings API errors
         """
         try:
-            data = response.json()
+            data = response_json(response)
             if data.get("status") != 0:
                 error_msg = data.get("error", "Unknown error")
                 # Create an exception with the response attached for error strategy
@@ -374,6 +452,7 @@ class OAuth2AuthBase:
     
     # Constants
     SECONDS_PER_DAY = 24 * 3600
+    TOKEN_EXPIRY_BUFFER_SECONDS = 60
 
     def __init__(
         self,
@@ -418,6 +497,8 @@ class OAuth2AuthBase:
         config = CLIENT_CONFIG
         self.validity_days = config.validity_days
         self.refresh_buffer_hours = config.refresh_buffer_hours
+        self.max_retries = config.max_retries
+        self.retry_delays = config.retry_delays
         
         # Token storage
         self.token_file = os.path.expanduser(token_file)
@@ -434,9 +515,19 @@ class OAuth2AuthBase:
         # Disable SSL verification for testing (temporary fix for certificate issues)
         self.session.verify = False
         
+        # Keep connections alive for API and token endpoint calls; network
+        # errors are retried once, in make_request, not again by the adapter
+        configure_session(self.session, max_retries=0)
+        
         # Initialize error handling strategy (can be overridden by subclasses)
         self.error_strategy = StandardHttpErrorStrategy()
         
+        # Optional client-side pacing (subclasses set a TokenBucket)
+        self.rate_limiter: Optional[TokenBucket] = None
+        
+        # Serializes token refreshes across threads
+        self._refresh_lock = threading.Lock()
+        
         # Load existing token if available
         self._load_token()
 
@@ -446,18 +537,17 @@ class OAuth2AuthBase:
         Returns:
             True if token was loaded successfully
         """
-        if not os.path.exists(self.token_file):
-            return False
-            
         try:
-            with open(self.token_file, 'r') as f:
-                token_data = json.load(f)
+            token_data = load_token_file(self.token_file)
+            if token_data is None:
+                return False
                 
             # Convert to OAuth2Token
             self.token = OAuth2Token(token_data)
             
             # Update session with token
             self.session.token = self.token
+            self._invalidate_auth_cache()
             
             return True
         except Exception as e:
@@ -474,8 +564,7 @@ class OAuth2AuthBase:
         token_dict = dict(token)
         
         # Add sliding window expiration (90 days from now)
-        sliding_window_expires_at = datetime.now() + timedelta(days=self.validity_days)
-        token_dict['sliding_window_expires_at'] = sliding_window_expires_at.timestamp()
+        token_dict['sliding_window_expires_at'] = time.time() + self.validity_days * 86400
         token_dict['sliding_window_validity_days'] = self.validity_days
         
         # Create OAuth2Token with extended data
@@ -483,16 +572,35 @@ class OAuth2AuthBase:
         
         # Update session token to ensure it uses the new token
         self.session.token = self.token
+        self._invalidate_auth_cache()
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.token_file), exist_ok=True)
-        
+        # Write synchronously: a refresh may rotate the refresh token, and
+        # other readers of the token file must never see the revoked one
         try:
-            with open(self.token_file, 'w') as f:
-                json.dump(token_dict, f, indent=2)
+            # Ensure directory exists
+            os.makedirs(os.path.dirname(self.token_file), exist_ok=True)
+            write_token_file(self.token_file, token_dict)
         except Exception as e:
             print(f"Error saving token: {e}")
 
+    def set_token(self, token_data: dict) -> None:
+        """Replace the in-memory token without touching the token file.
+
+        Useful for reusing one client across scenarios (e.g. simulating an
+        expired token before a forced refresh) instead of re-constructing it.
+
+        Args:
+            token_data: Token dictionary to install on the client and session
+        """
+        self.token = OAuth2Token(token_data)
+        self.session.token = self.token
+        self._invalidate_auth_cache()
+
+    def _invalidate_auth_cache(self) -> None:
+        """Drop cached authentication checks after the token changes."""
+        self.__dict__.pop('_auth_cache', None)
+
+    @_ttl_cache(seconds=1)
     def is_in_sliding_window(self) -> bool:
         """Check if token is within the sliding window validity period.
         
@@ -506,11 +614,10 @@ class OAuth2AuthBase:
         if 'sliding_window_expires_at' not in self.token:
             return False
             
-        sliding_expires_at = datetime.fromtimestamp(self.token['sliding_window_expires_at'])
-        buffer_time = timedelta(hours=self.refresh_buffer_hours)
-        
-        return datetime.now() < (sliding_expires_at - buffer_time)
+        buffer_seconds = self.refresh_buffer_hours * 3600
+        return time.time() < self.token['sliding_window_expires_at'] - buffer_seconds
     
+    @_ttl_cache(seconds=1)
     def should_refresh_proactively(self) -> bool:
         """Check if token should be refreshed proactively.
         
@@ -526,6 +633,23 @@ class OAuth2AuthBase:
             
         return False
 
+    def should_refresh(self, buffer: Optional[int] = None) -> bool:
+        """Check if the access token expires within ``buffer`` seconds.
+
+        Args:
+            buffer: Seconds of remaining lifetime below which to refresh
+                (defaults to TOKEN_EXPIRY_BUFFER_SECONDS)
+
+        Returns:
+            True if the access token should be refreshed before the next request
+        """
+        if not self.token or not self.token.get('expires_at'):
+            return False
+        if buffer is None:
+            buffer = self.TOKEN_EXPIRY_BUFFER_SECONDS
+        return time.time() >= self.token['expires_at'] - buffer
+
+    @_ttl_cache(seconds=1)
     def is_authenticated(self) -> bool:
         """Check if we have a valid token using sliding window approach.
         
@@ -647,9 +771,11 @@ class OAuth2AuthBase:
             "redirect_uri": self.redirect_uri,
         }
         
-        response = requests.post(self.token_endpoint, data=token_data, verify=False)
+        response = self.session.post(
+            self.token_endpoint, data=token_data, verify=False, withhold_token=True
+        )
         response.raise_for_status()
-        return response.json()
+        return response_json(response)
 
     def _is_authentication_error(self, error: Exception, response=None) -> bool:
         """Check if an error indicates authentication failure using the configured strategy.
@@ -674,6 +800,10 @@ class OAuth2AuthBase:
         """
         if not self.token:
             return False
+        
+        # Remember the token the refresh decision is based on; if another
+        # thread swaps in a new one before we get the lock, it already refreshed
+        observed_token = self.token
             
         # If force is True, skip sliding window checks and refresh immediately
         if force:
@@ -688,21 +818,28 @@ class OAuth2AuthBase:
         # Token needs refresh - check if we have a refresh token
         if 'refresh_token' not in self.token:
             return False
+        
+        # Single-flight: concurrent callers that saw the same stale token wait
+        # here, and only the first one performs the HTTP refresh
+        with self._refresh_lock:
+            if self.token is not observed_token:
+                return True  # Another thread already refreshed
             
-        try:
-            # Use overridable method for token refresh
-            new_token = self._refresh_access_token()
-            
-            self._save_token(OAuth2Token(new_token))
-            
-            # Update session with new token
-            self.session.token = self.token
-            
-            return True
-            
-        except Exception as e:
-            print(f"Token refresh failed: {e}")
-            return False
+            try:
+                # Use overridable method for token refresh
+                new_token = self._refresh_access_token()
+                
+                self._save_token(OAuth2Token(new_token))
+                
+                # Update session with new token
+                self.session.token = self.token
+                self._invalidate_auth_cache()
+                
+                return True
+                
+            except Exception as e:
+                print(f"Token refresh failed: {e}")
+                return False
 
     def _refresh_access_token(self) -> dict:
         """Refresh the access token using the refresh token.
@@ -727,9 +864,11 @@ class OAuth2AuthBase:
             "grant_type": "refresh_token",
         }
         
-        response = requests.post(self.token_endpoint, data=refresh_data, verify=False)
+        response = self.session.post(
+            self.token_endpoint, data=refresh_data, verify=False, withhold_token=True
+        )
         response.raise_for_status()
-        return response.json()
+        return response_json(response)
 
     def get_valid_token(self) -> Optional[str]:
         """Get a valid access token.
@@ -778,6 +917,11 @@ class OAuth2AuthBase:
         token = self.get_valid_token()
         if not token:
             raise Exception("Failed to obtain valid access token")
+        
+        # Refresh before dispatch when the access token is about to expire,
+        # rather than waiting for the API to reject it
+        if self.should_refresh():
+            self.refresh_token_if_needed(force=True)
             
         # Ensure session token is up to date
         self.session.token = self.token
@@ -785,10 +929,14 @@ class OAuth2AuthBase:
         # Build full URL
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         
-        # Make request with automatic retry on auth errors
-        max_retries = 2
-        for attempt in range(max_retries):
+        # Make request with automatic retry on auth errors (once) and on
+        # transient failures (with jittered backoff honoring Retry-After)
+        max_attempts = self.max_retries + 1
+        auth_retried = False
+        for attempt in range(max_attempts):
             try:
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -797,21 +945,42 @@ class OAuth2AuthBase:
                     **kwargs
                 )
                 
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    if response.status_code == 429 and self.rate_limiter:
+                        self.rate_limiter.on_throttle()
+                    if attempt < max_attempts - 1:
+                        wait_time = backoff_delay(attempt, self.retry_delays, response)
+                        print(f"⚠️  HTTP {response.status_code}, retrying in {wait_time:.1f} seconds...")
+                        time.sleep(wait_time)
+                        continue
+                
                 response.raise_for_status()
                 
                 # Allow error strategy to validate successful responses (e.g., Withings status != 0)
                 if hasattr(self.error_strategy, 'validate_response'):
                     self.error_strategy.validate_response(response)
                 
+                if self.rate_limiter:
+                    self.rate_limiter.on_success()
                 return response
                 
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # Transient network failure; back off and try again
+                if attempt < max_attempts - 1:
+                    wait_time = backoff_delay(attempt, self.retry_delays)
+                    print(f"⚠️  Network error (attempt {attempt + 1}): {e}; retrying in {wait_time:.1f} seconds...")
+                    time.sleep(wait_time)
+                    continue
+                raise
+                
             except Exception as e:
                 # Check if this is an authentication error
                 response_for_error = getattr(e, 'response', None)
                 is_auth_error = self._is_authentication_error(e, response_for_error)
                 
-                # Only retry on auth errors and if we have retries left
-                if is_auth_error and attempt < max_retries - 1:
+                # Only retry auth errors once, and only if we have attempts left
+                if is_auth_error and not auth_retried and attempt < max_attempts - 1:
+                    auth_retried = True
                     print(f"⚠️  Authentication error (attempt {attempt + 1}): {e}")
                     
                     # Try refresh first
@@ -0,0 +1,137 @@
+"""Client-side request pacing shared by API clients."""
+
+import random
+import threading
+import time
+from typing import Mapping, Optional, Sequence
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# Responses worth retrying: throttling and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Adaptive token bucket rate limiter.
+
+    Requests take one token each; tokens refill at ``rate`` per second up to
+    ``capacity``. The rate adapts to the server: it grows additively after
+    successful requests and is halved whenever the server throttles us, so
+    steady-state throughput settles just under the real limit instead of
+    oscillating between bursts and long exponential backoffs.
+
+    Thread-safe, so concurrent page fetches share one budget.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        capacity: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        increase: float = 0.5,
+    ):
+        """Initialize the bucket.
+
+        Args:
+            rate: Initial refill rate in requests per second
+            capacity: Maximum burst size
+            min_rate: Floor for the rate after repeated throttling
+            max_rate: Ceiling for the rate (defaults to the initial rate)
+            increase: Rate added after each successful request
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.increase = increase
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self) -> None:
+        """Block until a request token is available, then consume it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self) -> None:
+        """Halve the rate after the server throttled a request."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+
+def retry_after_seconds(response: requests.Response, default: Optional[float]) -> Optional[float]:
+    """Read the Retry-After header of a throttled response.
+
+    Args:
+        response: The 429 response
+        default: Delay to use when the header is missing or not in seconds
+
+    Returns:
+        Number of seconds to wait before retrying
+    """
+    return retry_after_from_headers(response.headers, default)
+
+
+def retry_after_from_headers(headers: Mapping[str, str], default: Optional[float]) -> Optional[float]:
+    """Read Retry-After from a header mapping, e.g. a Graph $batch response item.
+
+    Args:
+        headers: Response headers; plain dicts are matched case-insensitively
+        default: Delay to use when the header is missing or not in seconds
+
+    Returns:
+        Number of seconds to wait before retrying
+    """
+    value = CaseInsensitiveDict(headers or {}).get("Retry-After")
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def backoff_delay(
+    attempt: int,
+    delays: Sequence[float],
+    response: Optional[requests.Response] = None,
+) -> float:
+    """Compute the wait before retrying a failed request.
+
+    A Retry-After header on the response wins. Otherwise the configured
+    delay for this attempt is used with equal jitter (half fixed, half
+    random), so concurrent workers that failed together do not retry in
+    lockstep.
+
+    Args:
+        attempt: Zero-based index of the attempt that failed
+        delays: Base delays per attempt; the last one repeats
+        response: The failed response, if one was received
+
+    Returns:
+        Number of seconds to wait before retrying
+    """
+    if response is not None:
+        retry_after = retry_after_seconds(response, default=None)
+        if retry_after is not None:
+            return retry_after
+    
+    base = delays[min(attempt, len(delays) - 1)] if delays else 2**attempt
+    return base / 2 + random.uniform(0, base / 2)
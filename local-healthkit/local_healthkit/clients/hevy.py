@@ -1,14 +1,37 @@
 """Hevy API client using API key authentication."""
 
+import itertools
 import os
 import time
-from datetime import datetime
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from .base.api_key_auth import APIKeyAuthBase
 from .base.config import ClientFactory
+from .base.json_utils import response_json
+
+
+# Date bounds are naive local day boundaries while start_time is UTC, and
+# the pipeline assigns workout days in its own configured timezone rather
+# than the machine's. Filtering with a day of slack on each side covers any
+# UTC offset, so no workout that could land in range is dropped here; the
+# exact day is decided downstream.
+_RANGE_SLACK = timedelta(days=1)
+
+
+def _parse_start_time(value: str) -> datetime:
+    """Parse a Hevy ISO-8601 timestamp into a naive UTC datetime.
+
+    Timestamps without an offset are taken as UTC, matching how the
+    pipeline's Hevy extractor reads them.
+    """
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
 
 
 class HevyClient(APIKeyAuthBase):
@@ -18,6 +41,12 @@ class HevyClient(APIKeyAuthBase):
     No OAuth2 flows, token refresh, or persistent authentication needed.
     """
     
+    # Number of workout pages fetched concurrently
+    PAGE_FETCH_CONCURRENCY = 4
+    
+    # Largest pageSize the Hevy workouts endpoint accepts
+    MAX_PAGE_SIZE = 10
+    
     def __init__(self, page_size: Optional[int] = None):
         """Initialize the Hevy client.
         
@@ -34,13 +63,13 @@ class HevyClient(APIKeyAuthBase):
             base_url=service_config["base_url"]
         )
         
-        self.page_size = page_size or service_config["default_page_size"]
+        self.page_size = min(page_size or service_config["default_page_size"], self.MAX_PAGE_SIZE)
     
     def get_workouts(
         self, 
         start_date: datetime = None, 
         end_date: datetime = None,
-        page_size: int = 10  # Match source of truth: AppConfig.HEVY_DEFAULT_PAGE_SIZE = 10
+        page_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get workout data from the Hevy API.
         
@@ -50,40 +79,139 @@ class HevyClient(APIKeyAuthBase):
         Args:
             start_date: Start date for filtering (applied client-side)
             end_date: End date for filtering (applied client-side)
-            page_size: Number of workouts per page (default from init)
+            page_size: Number of workouts per page (default from init, capped
+                at MAX_PAGE_SIZE)
             
         Returns:
-            Dictionary containing workout data
+            Dictionary containing workout data from every page in range
         """
         # Use provided page_size or fall back to instance default
         if page_size is None:
             page_size = self.page_size
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
         
-        all_workouts = []
-        page = 1
+        # The first page tells us how many pages exist
+        first_page = self._fetch_workout_page(1, page_size)
+        workouts = first_page.get("workouts", [])
+        in_range, done = self._filter_workouts(workouts, start_date, end_date)
+        pages = [in_range]
+        page_count = first_page.get("page_count")
         
-        while True:
-            params = {
-                "page": page,
-                "pageSize": page_size
-            }
-            
-            response = self.make_request("v1/workouts", params=params)
-            data = response.json()
-            workouts = data.get("workouts", [])
-            
-            if not workouts:
-                break
-            
-            all_workouts.extend(workouts)
-            page += 1
+        if page_count:
+            # Fetch the remaining pages in concurrent batches; map() keeps page
+            # order so we can stop once a page reaches past start_date. Every
+            # page of a batch is requested before we know where the walk ends,
+            # so up to PAGE_FETCH_CONCURRENCY - 1 pages after the stop page may
+            # be fetched and discarded - an accepted cost of fetching in
+            # parallel. The next batch is only submitted once the whole
+            # current batch has been checked.
+            next_page = 2
+            with ThreadPoolExecutor(max_workers=self.PAGE_FETCH_CONCURRENCY) as executor:
+                while not done and next_page <= page_count:
+                    batch = range(next_page, min(next_page + self.PAGE_FETCH_CONCURRENCY, page_count + 1))
+                    next_page = batch.stop
+                    responses = executor.map(
+                        lambda page: self._fetch_workout_page(page, page_size), batch
+                    )
+                    for data in responses:
+                        if "workouts" not in data:
+                            done = True
+                            break
+                        in_range, done = self._filter_workouts(
+                            data["workouts"], start_date, end_date
+                        )
+                        pages.append(in_range)
+                        if done:
+                            break
+        elif len(workouts) == page_size:
+            # No page count reported - walk pages until a short one
+            page = 2
+            while not done:
+                data = self._fetch_workout_page(page, page_size)
+                if "workouts" not in data:
+                    break
+                workouts = data["workouts"]
+                in_range, done = self._filter_workouts(workouts, start_date, end_date)
+                pages.append(in_range)
+                page += 1
+                if len(workouts) < page_size:
+                    break
+        
+        # Flatten once instead of growing a list page by page
+        return {"workouts": list(itertools.chain.from_iterable(pages))}
+    
+    @staticmethod
+    def _filter_workouts(
+        workouts: List[Dict[str, Any]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Keep workouts inside the date range.
+        
+        Hevy returns workouts newest first, so once a page contains a workout
+        older than start_date no later page can be in range. Both bounds are
+        widened by _RANGE_SLACK, so this is a coarse filter; workouts without
+        a start_time are dropped because the extractor skips them anyway.
+        
+        Args:
+            workouts: Raw workouts from one page
+            start_date: Inclusive lower bound (None for no bound)
+            end_date: Inclusive upper bound (None for no bound)
             
-            # If we got fewer workouts than page size, we're done
-            if len(workouts) < page_size:
-                break
+        Returns:
+            Tuple of (in-range workouts, whether pagination can stop)
+        """
+        if start_date is None and end_date is None:
+            return list(workouts), False
+        
+        if start_date is not None:
+            start_date = start_date - _RANGE_SLACK
+        if end_date is not None:
+            end_date = end_date + _RANGE_SLACK
         
-        return {"workouts": all_workouts}
+        in_range = []
+        reached_start = False
+        for workout in workouts:
+            start_time = workout.get("start_time")
+            if not start_time:
+                continue
+            timestamp = _parse_start_time(start_time)
+            if start_date is not None and timestamp < start_date:
+                reached_start = True
+                continue
+            if end_date is not None and timestamp > end_date:
+                continue
+            in_range.append(workout)
+        return in_range, reached_start
     
+    def _fetch_workout_page(self, page: int, page_size: int) -> Dict[str, Any]:
+        """Fetch a single page of workouts.
+        
+        Args:
+            page: 1-based page number
+            page_size: Number of workouts per page
+            
+        Returns:
+            Raw page response (workouts, page, page_count)
+        """
+        params = {
+            "page": page,
+            "pageSize": page_size
+        }
+        response = self.make_request("v1/workouts", params=params)
+        return response_json(response)
+    
+    def get_workout_details(self, workout_id: str) -> Dict[str, Any]:
+        """Get a single workout with its exercises and sets.
+        
+        Args:
+            workout_id: ID of the workout to fetch
+            
+        Returns:
+            Workout data dictionary
+        """
+        response = self.make_request(f"v1/workouts/{workout_id}")
+        return response_json(response)
     
     def get_client_info(self) -> Dict[str, str]:
         """Get client information for debugging.
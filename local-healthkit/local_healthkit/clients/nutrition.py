@@ -2,10 +2,16 @@
 
 import os
 import logging
+import importlib.util
+import tempfile
 from datetime import datetime, date
 from typing import Dict, Any, Optional, List
+import numpy as np
 import pandas as pd
 
+# pyarrow is optional; when installed the CSV can be mirrored to Parquet or Feather
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 
 class NutritionClient:
     """Client for reading nutrition data from CSV files.
@@ -14,16 +20,64 @@ class NutritionClient:
     architectural patterns as API clients but for local file access.
     """
     
-    def __init__(self, data_dir: str = "data", filename: str = "dailysummary.csv"):
+    # Cronometer daily summary columns we read, mapped to our naming convention
+    COLUMN_MAP = {
+        "Date": "date",
+        "Energy (kcal)": "calories",
+        "Protein (g)": "protein",
+        "Carbs (g)": "carbs",
+        "Fat (g)": "fat",
+        "Alcohol (g)": "alcohol",
+    }
+    CSV_COLUMNS = list(COLUMN_MAP)
+    
+    # Parse nutrient columns straight to float instead of coercing afterwards;
+    # files with stray non-numeric cells fall back to coercion (see _read_csv)
+    NUTRIENT_COLUMNS = [col for col in CSV_COLUMNS if col != "Date"]
+    CSV_DTYPES = {col: "float64" for col in NUTRIENT_COLUMNS}
+    
+    # Cronometer writes ISO dates; an explicit format skips per-value inference
+    DATE_FORMAT = "%Y-%m-%d"
+    
+    # Rows parsed per chunk while streaming the CSV
+    CSV_CHUNK_SIZE = 10_000
+    
+    # Rows per Parquet row group; each group carries min/max Date statistics
+    PARQUET_ROW_GROUP_SIZE = 10_000
+    
+    # Supported columnar mirrors of the CSV and their file extensions
+    CACHE_EXTENSIONS = {"parquet": ".parquet", "feather": ".feather"}
+    
+    def __init__(
+        self,
+        data_dir: str = "data",
+        filename: str = "dailysummary.csv",
+        cache_format: Optional[str] = None
+    ):
         """Initialize the nutrition client.
         
         Args:
             data_dir: Directory containing the nutrition CSV file
             filename: Name of the nutrition data CSV file
+            cache_format: Opt-in columnar mirror of the CSV to read from when
+                pyarrow is installed ("parquet" or "feather"). The mirror is
+                written next to the CSV, which stays the source of truth.
+                None (the default) always reads the CSV and writes nothing.
+                
+        Raises:
+            ValueError: If cache_format is not supported
         """
+        if cache_format is not None and cache_format not in self.CACHE_EXTENSIONS:
+            raise ValueError(f"Unsupported cache format: {cache_format}")
+        
         self.logger = logging.getLogger(self.__class__.__name__)
         self.data_dir = data_dir
         self.filename = filename
+        self.cache_format = cache_format if _HAS_PYARROW else None
+        
+        # Last processed frame, keyed by file identity and date range
+        self._cache: Optional[pd.DataFrame] = None
+        self._cache_key: Optional[tuple] = None
         self.data_file = self._get_file_path()
         
     def _get_file_path(self) -> Optional[str]:
@@ -32,11 +86,13 @@ class NutritionClient:
         Returns:
             Full path to the file if it exists, None otherwise
         """
-        if os.path.exists(self.data_dir):
-            file_path = os.path.join(self.data_dir, self.filename)
-            if os.path.exists(file_path):
-                return file_path
-        return None
+        # A single stat on the file also covers a missing data directory
+        file_path = os.path.join(self.data_dir, self.filename)
+        try:
+            os.stat(file_path)
+        except OSError:
+            return None
+        return file_path
     
     def get_nutrition_data(
         self, 
@@ -57,32 +113,32 @@ class NutritionClient:
         """
         self.logger.info(f"Reading nutrition data from {self.data_file}")
         
-        # Check if file exists
-        if not self.data_file or not os.path.exists(self.data_file):
+        # A file deleted since init surfaces as FileNotFoundError from the read
+        if not self.data_file:
             raise FileNotFoundError(f"Nutrition data file not found: {self.data_file}")
 
         try:
-            # Load and process the CSV data
-            df = self._load_and_process_csv()
+            # Load and process the CSV data for the requested date range
+            df = self._load_and_process_csv(start_date, end_date)
             
-            # Filter by date range if provided
-            if start_date:
-                df = df[df["date"] >= pd.Timestamp(start_date)]
-            if end_date:
-                df = df[df["date"] <= pd.Timestamp(end_date)]
+            # Convert DataFrame to list of dictionaries. Dates are formatted in
+            # one vectorized call and itertuples yields plain tuples of Python
+            # floats, so no per-row Series or float() conversion is needed
+            rows = df.assign(date=df["date"].dt.strftime("%Y-%m-%d"))[
+                ["date", "calories", "protein", "carbs", "fat", "alcohol"]
+            ].itertuples(index=False, name=None)
             
-            # Convert DataFrame to list of dictionaries
-            nutrition_records = []
-            for _, row in df.iterrows():
-                record = {
-                    "date": row["date"].strftime("%Y-%m-%d"),
-                    "calories": float(row["calories"]),
-                    "protein": float(row["protein"]),
-                    "carbs": float(row["carbs"]),
-                    "fat": float(row["fat"]),
-                    "alcohol": float(row["alcohol"])
+            nutrition_records = [
+                {
+                    "date": d,
+                    "calories": cal,
+                    "protein": prot,
+                    "carbs": carb,
+                    "fat": f,
+                    "alcohol": alc
                 }
-                nutrition_records.append(record)
+                for d, cal, prot, carb, f, alc in rows
+            ]
             
             self.logger.info(f"Successfully loaded {len(nutrition_records)} nutrition records")
             return nutrition_records
@@ -91,34 +147,303 @@ class NutritionClient:
             self.logger.error(f"Error reading nutrition data: {e}")
             raise
     
-    def _load_and_process_csv(self) -> pd.DataFrame:
+    def _read_csv(
+        self,
+        start_ts: Optional[pd.Timestamp],
+        end_ts: Optional[pd.Timestamp]
+    ) -> pd.DataFrame:
+        """Read the CSV, coercing stray non-numeric nutrient cells to NaN.
+        
+        Clean exports are parsed straight to float. A cell read_csv cannot
+        parse (e.g. "—" or "1,234") makes the typed read raise, in which case
+        the file is re-read untyped and bad cells become missing values, as
+        they would with pd.to_numeric(errors="coerce").
+        
+        Args:
+            start_ts: Optional inclusive lower date bound
+            end_ts: Optional inclusive upper date bound
+            
+        Returns:
+            Raw rows (source column names) within the date range
+        """
+        try:
+            return self._read_csv_chunks(start_ts, end_ts)
+        except ValueError as e:
+            self.logger.warning(f"Non-numeric values in {self.data_file}, coercing to NaN: {e}")
+            return self._read_csv_chunks(start_ts, end_ts, coerce=True)
+    
+    def _read_csv_chunks(
+        self,
+        start_ts: Optional[pd.Timestamp],
+        end_ts: Optional[pd.Timestamp],
+        coerce: bool = False
+    ) -> pd.DataFrame:
+        """Stream the CSV in chunks, dropping out-of-range rows per chunk.
+        
+        While the file is in ascending date order, reading stops at the first
+        chunk that starts after end_ts instead of parsing the rest of it.
+        
+        Args:
+            start_ts: Optional inclusive lower date bound
+            end_ts: Optional inclusive upper date bound
+            coerce: Read nutrient columns untyped and coerce them to float,
+                turning unparseable cells into NaN
+            
+        Returns:
+            Raw rows (source column names) within the date range
+        """
+        chunks = []
+        sorted_so_far = True
+        last_date = None
+        with pd.read_csv(
+            self.data_file,
+            usecols=self.CSV_COLUMNS,
+            dtype=None if coerce else self.CSV_DTYPES,
+            na_values=[""],
+            chunksize=self.CSV_CHUNK_SIZE,
+        ) as reader:
+            for chunk in reader:
+                if coerce:
+                    chunk = self._coerce_nutrients(chunk)
+                # Parse the whole date column at once with a fixed format;
+                # cache=True converts each repeated date string only once
+                dates = pd.to_datetime(chunk["Date"], format=self.DATE_FORMAT, cache=True)
+                chunk["Date"] = dates
+                if sorted_so_far and len(chunk):
+                    sorted_so_far = dates.is_monotonic_increasing and (
+                        last_date is None or dates.iloc[0] >= last_date
+                    )
+                    last_date = dates.iloc[-1]
+                    if sorted_so_far and end_ts is not None and dates.iloc[0] > end_ts:
+                        break
+                chunks.append(self._slice_date_range(chunk, start_ts, end_ts))
+        
+        if chunks:
+            return pd.concat(chunks, ignore_index=True)
+        
+        # Header-only file: keep the datetime dtype for the date column
+        data = pd.DataFrame({col: pd.Series(dtype="float64") for col in self.CSV_COLUMNS})
+        data["Date"] = pd.Series(dtype="datetime64[ns]")
+        return data
+    
+    @classmethod
+    def _coerce_nutrients(cls, data: pd.DataFrame) -> pd.DataFrame:
+        """Convert nutrient columns to float, turning bad cells into NaN.
+        
+        Args:
+            data: Raw rows with untyped nutrient columns
+            
+        Returns:
+            The same rows with float64 nutrient columns
+        """
+        data[cls.NUTRIENT_COLUMNS] = data[cls.NUTRIENT_COLUMNS].apply(
+            pd.to_numeric, errors="coerce"
+        ).astype("float64")
+        return data
+    
+    @staticmethod
+    def _slice_date_range(
+        chunk: pd.DataFrame,
+        start_ts: Optional[pd.Timestamp],
+        end_ts: Optional[pd.Timestamp]
+    ) -> pd.DataFrame:
+        """Keep the rows of a chunk within the date range.
+        
+        Daily summaries are normally written in date order, in which case the
+        bounds are found by binary search and the chunk is sliced without
+        building a boolean mask. Unsorted chunks fall back to masking.
+        
+        Args:
+            chunk: Raw rows with a datetime "Date" column
+            start_ts: Optional inclusive lower date bound
+            end_ts: Optional inclusive upper date bound
+            
+        Returns:
+            Rows within the date range
+        """
+        if start_ts is None and end_ts is None:
+            return chunk
+        
+        dates = chunk["Date"]
+        if dates.is_monotonic_increasing:
+            lo = dates.searchsorted(start_ts, side="left") if start_ts is not None else 0
+            hi = dates.searchsorted(end_ts, side="right") if end_ts is not None else len(chunk)
+            return chunk.iloc[lo:hi]
+        
+        if start_ts is not None:
+            chunk = chunk[chunk["Date"] >= start_ts]
+        if end_ts is not None:
+            chunk = chunk[chunk["Date"] <= end_ts]
+        return chunk
+    
+    def _read_parquet(
+        self,
+        parquet_file: str,
+        start_ts: Optional[pd.Timestamp],
+        end_ts: Optional[pd.Timestamp]
+    ) -> pd.DataFrame:
+        """Read the Parquet mirror, letting pyarrow skip row groups by date.
+        
+        Args:
+            parquet_file: Path to the Parquet mirror of the CSV
+            start_ts: Optional inclusive lower date bound
+            end_ts: Optional inclusive upper date bound
+            
+        Returns:
+            Raw rows (source column names) within the date range
+        """
+        filters = []
+        if start_ts is not None:
+            filters.append(("Date", ">=", start_ts))
+        if end_ts is not None:
+            filters.append(("Date", "<=", end_ts))
+        
+        return pd.read_parquet(
+            parquet_file,
+            engine="pyarrow",
+            columns=self.CSV_COLUMNS,
+            filters=filters or None,
+        )
+    
+    def _read_feather(
+        self,
+        feather_file: str,
+        start_ts: Optional[pd.Timestamp],
+        end_ts: Optional[pd.Timestamp]
+    ) -> pd.DataFrame:
+        """Read the Feather mirror and slice it to the date range.
+        
+        Arrow IPC maps straight into pandas without tokenizing text; the
+        mirror is written in date order, so the range is a binary-search slice.
+        
+        Args:
+            feather_file: Path to the Feather mirror of the CSV
+            start_ts: Optional inclusive lower date bound
+            end_ts: Optional inclusive upper date bound
+            
+        Returns:
+            Raw rows (source column names) within the date range
+        """
+        data = pd.read_feather(feather_file, columns=self.CSV_COLUMNS)
+        return self._slice_date_range(data, start_ts, end_ts)
+    
+    def _ensure_cache_file(self) -> Optional[str]:
+        """Write the columnar mirror of the CSV when it is missing or stale.
+        
+        Rows are sorted by date so each Parquet row group covers a contiguous
+        date span and Feather reads can be sliced by binary search.
+        
+        Returns:
+            Path to an up-to-date cache file, or None to fall back to CSV
+        """
+        cache_file = os.path.splitext(self.data_file)[0] + self.CACHE_EXTENSIONS[self.cache_format]
+        try:
+            csv_mtime = os.path.getmtime(self.data_file)
+            if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= csv_mtime:
+                return cache_file
+            
+            # pyarrow is installed whenever a cache is enabled; its
+            # multithreaded parser handles the one full read per CSV change
+            try:
+                data = pd.read_csv(
+                    self.data_file,
+                    engine="pyarrow",
+                    parse_dates=["Date"],
+                    usecols=self.CSV_COLUMNS,
+                    dtype=self.CSV_DTYPES,
+                    na_values=[""],
+                )
+            except ValueError:
+                # Same fallback as _read_csv for stray non-numeric cells
+                data = self._read_csv(None, None)
+            data = data.sort_values("Date", ignore_index=True)
+            # A uniquely named temp file per writer, synced before the rename,
+            # so concurrent rebuilds never publish each other's partial output
+            fd, tmp_file = tempfile.mkstemp(
+                dir=os.path.dirname(cache_file) or ".",
+                prefix=f".{os.path.basename(cache_file)}.",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    if self.cache_format == "feather":
+                        data.to_feather(f, compression="lz4")
+                    else:
+                        data.to_parquet(
+                            f,
+                            engine="pyarrow",
+                            index=False,
+                            row_group_size=self.PARQUET_ROW_GROUP_SIZE,
+                        )
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, cache_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp_file)
+                except FileNotFoundError:
+                    pass
+                raise
+            self.logger.info(f"Wrote {self.cache_format} cache {cache_file}")
+            return cache_file
+        except Exception as e:
+            self.logger.warning(f"{self.cache_format} cache unavailable, reading CSV directly: {e}")
+            return None
+    
+    def _load_and_process_csv(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> pd.DataFrame:
         """Load and process nutrition data from CSV file.
         
+        Only rows inside the date range and only the columns we use are
+        loaded, so memory scales with the requested window rather than the
+        whole export.
+        
+        Args:
+            start_date: Optional inclusive start of the date range
+            end_date: Optional inclusive end of the date range
+        
         Returns:
             Processed DataFrame with nutrition data
         """
-        # Load CSV with proper date parsing
-        data = pd.read_csv(self.data_file, parse_dates=["Date"])
+        start_ts = pd.Timestamp(start_date) if start_date else None
+        end_ts = pd.Timestamp(end_date) if end_date else None
+        
+        # Reuse the previous result while the file and range are unchanged
+        stat = os.stat(self.data_file)
+        cache_key = (self.data_file, stat.st_mtime_ns, stat.st_size, start_ts, end_ts)
+        if cache_key == self._cache_key:
+            return self._cache.copy(deep=False)
+        
+        cache_file = self._ensure_cache_file() if self.cache_format else None
+        if cache_file and self.cache_format == "feather":
+            data = self._read_feather(cache_file, start_ts, end_ts)
+        elif cache_file:
+            data = self._read_parquet(cache_file, start_ts, end_ts)
+        else:
+            data = self._read_csv(start_ts, end_ts)
 
-        # Create new columns with our naming convention
-        data["calories"] = pd.to_numeric(data["Energy (kcal)"], errors="coerce")
-        data["protein"] = pd.to_numeric(data["Protein (g)"], errors="coerce")
-        data["carbs"] = pd.to_numeric(data["Carbs (g)"], errors="coerce")
-        data["fat"] = pd.to_numeric(data["Fat (g)"], errors="coerce")
-        data["alcohol"] = pd.to_numeric(data["Alcohol (g)"], errors="coerce")
-        data["date"] = data["Date"]
+        # Rename to our naming convention; columns are already typed by read_csv
+        data = data.rename(columns=self.COLUMN_MAP)
 
-        # Fill missing values with zeros
+        # Fill missing values with zeros in one pass over the typed block
         numeric_cols = ["calories", "protein", "carbs", "fat", "alcohol"]
-        for col in numeric_cols:
-            data[col] = data[col].fillna(0)
+        data[numeric_cols] = data[numeric_cols].fillna(0)
 
-        # Select and round relevant columns
+        # Select relevant columns
         summary = data[
             ["date", "calories", "protein", "carbs", "fat", "alcohol"]
         ].copy()
-        summary = summary.round(
-            {"calories": 0, "protein": 1, "carbs": 1, "fat": 1, "alcohol": 1}
-        )
 
-        return summary
+        # Round the numeric block in place: calories to whole numbers,
+        # macros to one decimal
+        values = summary[numeric_cols].to_numpy(dtype="float64", copy=True)
+        np.round(values[:, :1], 0, out=values[:, :1])
+        np.round(values[:, 1:], 1, out=values[:, 1:])
+        summary[numeric_cols] = values
+
+        self._cache = summary
+        self._cache_key = cache_key
+        return summary.copy(deep=False)
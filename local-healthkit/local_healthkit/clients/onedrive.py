@@ -2,8 +2,11 @@
 
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import msal
 import requests
@@ -11,6 +14,40 @@ from msal import PublicClientApplication
 
 from .base.oauth2_auth_base import TokenFileManager, SlidingWindowValidator
 from .base.config import ClientFactory
+from .base.http import configure_session
+from .base.json_utils import response_json
+from .base.rate_limit import backoff_delay, retry_after_from_headers
+
+# MSAL token caches per client ID and MSAL apps per (client ID, authority),
+# shared by every OneDriveClient in the process. A new client instance then
+# reuses tokens MSAL already holds in memory, and the authority discovery
+# request made when an app is built happens once per process.
+_MSAL_TOKEN_CACHES: Dict[str, msal.SerializableTokenCache] = {}
+_MSAL_APPS: Dict[Tuple[str, str], PublicClientApplication] = {}
+_MSAL_LOCK = threading.Lock()
+
+
+def _shared_token_cache(client_id: str) -> msal.SerializableTokenCache:
+    """Return the process-wide MSAL token cache for a client ID."""
+    with _MSAL_LOCK:
+        return _MSAL_TOKEN_CACHES.setdefault(client_id, msal.SerializableTokenCache())
+
+
+def _shared_msal_app(
+    client_id: str, authority: str, token_cache: msal.SerializableTokenCache
+) -> PublicClientApplication:
+    """Return the process-wide MSAL app for a client ID and authority."""
+    key = (client_id, authority)
+    with _MSAL_LOCK:
+        app = _MSAL_APPS.get(key)
+        if app is None:
+            app = PublicClientApplication(
+                client_id=client_id,
+                authority=authority,
+                token_cache=token_cache,
+            )
+            _MSAL_APPS[key] = app
+        return app
 
 
 class OneDriveClient:
@@ -18,6 +55,29 @@ class OneDriveClient:
 
     # Constants
     SECONDS_PER_DAY = 24 * 3600
+    
+    # Graph rejects simple (single PUT) uploads above 4 MB
+    SIMPLE_UPLOAD_MAX_BYTES = 4 * 1024 * 1024
+    
+    # Upload session chunks must be multiples of 320 KiB
+    UPLOAD_CHUNK_SIZE = 10 * 320 * 1024
+    
+    # How long a validated access token is reused before re-checking expiry;
+    # never past the token's own expires_at (see _get_access_token)
+    TOKEN_CHECK_INTERVAL_SECONDS = 300
+    
+    # Number of files uploaded concurrently by upload_files
+    UPLOAD_CONCURRENCY = 4
+    
+    # Maximum number of requests Microsoft Graph accepts in one $batch call
+    BATCH_MAX_REQUESTS = 20
+    
+    # Graph throttling responses; the request was not processed, so any
+    # method can be resent
+    THROTTLE_STATUS_CODES = frozenset({429, 503})
+    
+    # Transient gateway errors, only resent for idempotent GETs
+    GET_RETRY_STATUS_CODES = THROTTLE_STATUS_CODES | {502, 504}
 
     def __init__(self):
         """Initialize the OneDrive client.
@@ -46,6 +106,10 @@ class OneDriveClient:
         self.scopes = service_config["scopes"]
         self.base_url = service_config["base_url"]
         
+        # Throttling retries for Graph 429/503 responses using shared config
+        self.max_retries = client_config.max_retries
+        self.retry_delays = client_config.retry_delays
+        
         # Token validity configuration using shared config
         self.validity_days = client_config.validity_days
         self.refresh_buffer_hours = client_config.refresh_buffer_hours
@@ -54,24 +118,32 @@ class OneDriveClient:
         self.token_file = self.token_manager.token_file
         self.token = None
         self.access_token = None
+        self._next_refresh_check = 0.0
         
-        # Initialize MSAL token cache
-        self.msal_token_cache = msal.SerializableTokenCache()
+        # Serializes token checks and MSAL silent refreshes across threads
+        self._token_lock = threading.RLock()
         
-        # MSAL app will be initialized lazily when needed
+        # MSAL token cache shared with other clients using this client ID
+        self.msal_token_cache = _shared_token_cache(self.client_id)
+        
+        # Shared MSAL app will be looked up lazily when needed
         self.app = None
         
+        # Pooled session so folder check, upload and createLink share one
+        # connection. The adapter only retries failed connections; status
+        # retries happen once, in _send
+        self.session = configure_session(requests.Session())
+        
+        # Last ETag and parsed body per metadata endpoint for conditional GETs
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+        
         # Load existing token if available
         self._load_token()
 
     def _ensure_msal_app(self) -> None:
         """Initialize MSAL app if not already done."""
         if self.app is None:
-            self.app = PublicClientApplication(
-                client_id=self.client_id,
-                authority=self.authority,
-                token_cache=self.msal_token_cache,
-            )
+            self.app = _shared_msal_app(self.client_id, self.authority, self.msal_token_cache)
 
     def _load_token(self) -> bool:
         """Load token from file using shared token manager.
@@ -94,15 +166,25 @@ class OneDriveClient:
         self.token = token_data
         return True
 
-    def _save_token(self, token_data: dict) -> None:
-        """Save token to file."""
-        # Add MSAL cache to extra data
-        extra_data = {"msal_cache": self.msal_token_cache.serialize()}
+    def _save_token(self, token_data: dict, merge_into_existing: bool = False) -> None:
+        """Save token to file.
+        
+        Args:
+            token_data: Token fields to save
+            merge_into_existing: Update the current token in place with these
+                fields instead of replacing it (used for refreshes)
+        """
+        if merge_into_existing and self.token is not None:
+            self.token.update(token_data)
+        else:
+            self.token = dict(token_data)
+        
+        # Serialize the MSAL cache once per save
+        self.token["msal_cache"] = self.msal_token_cache.serialize()
         
         # Use shared token manager
         client_config = ClientFactory.get_client_config()
-        self.token_manager.save_token(token_data, client_config, extra_data)
-        self.token = {**token_data, **extra_data}
+        self.token_manager.save_token(self.token, client_config)
 
     def is_authenticated(self) -> bool:
         """Check if we have a valid authentication."""
@@ -152,6 +234,7 @@ class OneDriveClient:
         self.token_manager.clear_token()
         self.token = None
         self.access_token = None
+        self._next_refresh_check = 0.0
 
     def authenticate(self) -> bool:
         """Authenticate with OneDrive using MSAL device code flow.
@@ -184,7 +267,7 @@ class OneDriveClient:
         # Calculate extended expiration (90 days from now)
         expires_in = result.get("expires_in", 3600)
         extended_expires_in = self.validity_days * self.SECONDS_PER_DAY
-        expires_at = datetime.now() + timedelta(seconds=expires_in)
+        expires_at = time.time() + expires_in
         
         # Save tokens
         token_data = {
@@ -192,7 +275,7 @@ class OneDriveClient:
             "token_type": result.get("token_type", "Bearer"),
             "expires_in": expires_in,
             "extended_expires_in": extended_expires_in,
-            "expires_at": expires_at.timestamp(),
+            "expires_at": expires_at,
         }
         
         self._save_token(token_data)
@@ -204,12 +287,21 @@ class OneDriveClient:
     def refresh_token_if_needed(self, force: bool = False) -> bool:
         """Refresh token if needed using MSAL silent acquisition.
         
+        Serialized with other refreshes and token checks, so concurrent
+        uploads never run MSAL silent refreshes against the shared token
+        cache at the same time.
+        
         Args:
             force: Force refresh even if not needed
             
         Returns:
             bool: True if refresh was successful or not needed
         """
+        with self._token_lock:
+            return self._refresh_token(force)
+
+    def _refresh_token(self, force: bool) -> bool:
+        """Refresh the token; callers hold _token_lock (see refresh_token_if_needed)."""
         if not force and not self.should_refresh_proactively():
             return True
             
@@ -228,19 +320,18 @@ class OneDriveClient:
         if result and "access_token" in result:
             # Calculate new expiration
             expires_in = result.get("expires_in", 3600)
-            expires_at = datetime.now() + timedelta(seconds=expires_in)
+            expires_at = time.time() + expires_in
             
-            # Update token data
-            token_data = self.token.copy() if self.token else {}
-            token_data.update({
+            # Merge only the refreshed fields into the stored token
+            token_data = {
                 "access_token": result["access_token"],
                 "token_type": result.get("token_type", "Bearer"),
                 "expires_in": expires_in,
-                "expires_at": expires_at.timestamp(),
+                "expires_at": expires_at,
                 "last_refresh": datetime.now().isoformat()
-            })
+            }
             
-            self._save_token(token_data)
+            self._save_token(token_data, merge_into_existing=True)
             self.access_token = result["access_token"]
             
             return True
@@ -256,19 +347,36 @@ class OneDriveClient:
         Raises:
             Exception: If no valid token can be obtained
         """
-        # Check if we need to authenticate
-        if not self.is_authenticated():
-            if not self.authenticate():
-                raise Exception("Authentication failed")
-        
-        # Try to refresh if needed
-        if self.should_refresh_proactively():
-            self.refresh_token_if_needed()
-        
-        if not self.access_token:
-            raise Exception("No valid access token available")
+        # Skip the sliding-window checks if we validated recently
+        if self.access_token and time.monotonic() < self._next_refresh_check:
+            return self.access_token
+        
+        # One thread validates and refreshes; the others wait and then
+        # reuse its result instead of refreshing again
+        with self._token_lock:
+            now = time.monotonic()
+            if self.access_token and now < self._next_refresh_check:
+                return self.access_token
+            
+            # Check if we need to authenticate
+            if not self.is_authenticated():
+                if not self.authenticate():
+                    raise Exception("Authentication failed")
+            
+            # Try to refresh if needed
+            if self.should_refresh_proactively():
+                self._refresh_token(force=False)
             
-        return self.access_token
+            if not self.access_token:
+                raise Exception("No valid access token available")
+            
+            # Re-validate before the access token itself expires
+            interval = self.TOKEN_CHECK_INTERVAL_SECONDS
+            expires_at = self.token.get("expires_at") if self.token else None
+            if expires_at:
+                interval = max(0.0, min(interval, expires_at - time.time()))
+            self._next_refresh_check = now + interval
+            return self.access_token
 
     def make_request(self, endpoint: str, method: str = "GET", **kwargs) -> requests.Response:
         """Make an authenticated request to Microsoft Graph API.
@@ -292,19 +400,56 @@ class OneDriveClient:
         kwargs["headers"] = headers
         
         # Make request
-        response = requests.request(method, url, **kwargs)
+        response = self._send(method, url, **kwargs)
         
         # Check for authentication errors and retry once
         if response.status_code == 401:
             if self.refresh_token_if_needed(force=True):
                 headers["Authorization"] = f"Bearer {self._get_access_token()}"
                 kwargs["headers"] = headers
-                response = requests.request(method, url, **kwargs)
+                response = self._send(method, url, rewind=True, **kwargs)
             else:
                 raise Exception("Authentication failed and refresh unsuccessful")
         
         return response
 
+    def _send(self, method: str, url: str, rewind: bool = False, **kwargs) -> requests.Response:
+        """Send a request, waiting out Graph throttling and gateway errors.
+        
+        This is the only status-code retry layer: the session adapter only
+        retries failed connections. Throttled requests (429/503) are resent
+        for any method; GETs are also resent on 502/504. Waits honor Graph's
+        Retry-After header and otherwise use the configured jittered delays.
+        
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            rewind: Seek a streamed body back to the start before sending
+            **kwargs: Additional arguments passed to requests
+            
+        Returns:
+            The last response received
+        """
+        retry_statuses = (
+            self.GET_RETRY_STATUS_CODES if method.upper() == "GET" else self.THROTTLE_STATUS_CODES
+        )
+        for attempt in range(self.max_retries + 1):
+            if rewind or attempt:
+                # Rewind streamed bodies (e.g. upload file objects) before resending
+                data = kwargs.get("data")
+                if hasattr(data, "seek"):
+                    data.seek(0)
+            
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in retry_statuses or attempt == self.max_retries:
+                return response
+            
+            wait_time = backoff_delay(attempt, self.retry_delays, response)
+            print(f"⚠️  OneDrive request failed (HTTP {response.status_code}), retrying in {wait_time:.1f} seconds...")
+            time.sleep(wait_time)
+        
+        return response
+
     def upload_file(self, file_path: str, folder_name: str = None) -> str:
         """Upload a file to OneDrive.
         
@@ -322,26 +467,21 @@ class OneDriveClient:
             raise Exception(f"File not found: {file_path}")
         
         filename = os.path.basename(file_path)
+        file_size = os.path.getsize(file_path)
         
-        # Determine upload URL
-        if folder_name:
-            # Create folder if it doesn't exist
-            self._ensure_folder_exists(folder_name)
-            upload_endpoint = f"me/drive/root:/{folder_name}/{filename}:/content"
-        else:
-            upload_endpoint = f"me/drive/root:/{filename}:/content"
+        # Determine item path
+        item_path = f"{folder_name}/{filename}" if folder_name else filename
         
-        # Read file content
-        with open(file_path, "rb") as f:
-            file_content = f.read()
-        
-        # Upload file
-        response = self.make_request(upload_endpoint, method="PUT", data=file_content)
+        # Upload first and only create the folder if Graph reports it missing,
+        # saving the folder lookup round trip when it already exists
+        item = self._upload_item(file_path, item_path, file_size)
+        if item is None and folder_name:
+            self._create_folder(folder_name)
+            item = self._upload_item(file_path, item_path, file_size)
+        if item is None:
+            raise Exception(f"Upload failed: parent folder not found for {item_path}")
         
-        if response.status_code not in [200, 201]:
-            raise Exception(f"Upload failed: {response.text}")
-        
-        file_id = response.json()["id"]
+        file_id = item["id"]
         
         # Create sharing link
         response = self.make_request(
@@ -353,36 +493,179 @@ class OneDriveClient:
         if response.status_code not in [200, 201]:
             raise Exception(f"Failed to create sharing link: {response.text}")
         
-        share_url = response.json()["link"]["webUrl"]
+        share_url = response_json(response)["link"]["webUrl"]
         
         return share_url
 
-    def _ensure_folder_exists(self, folder_name: str) -> None:
-        """Ensure a folder exists in OneDrive, creating if necessary.
+    def upload_files(self, file_paths: List[str], folder_name: str = None) -> List[str]:
+        """Upload several files to OneDrive concurrently.
         
         Args:
-            folder_name: Name of the folder to ensure exists
+            file_paths: Paths of the files to upload
+            folder_name: Optional folder name to upload to
+            
+        Returns:
+            list: Shareable URLs in the same order as file_paths
+            
+        Raises:
+            Exception: If any upload fails
         """
-        # Check if folder exists
-        response = self.make_request(f"me/drive/root:/{folder_name}")
+        # Validate (and if needed refresh) the token once, before the
+        # workers start, so they all reuse it
+        if file_paths:
+            self._get_access_token()
+        
+        if folder_name and len(file_paths) > 1:
+            # Upload one file first so a missing folder is created once
+            # instead of by every concurrent upload
+            first_url = self.upload_file(file_paths[0], folder_name)
+            remaining = file_paths[1:]
+        else:
+            first_url = None
+            remaining = file_paths
         
-        if response.status_code == 404:
-            # Create folder
+        with ThreadPoolExecutor(max_workers=self.UPLOAD_CONCURRENCY) as executor:
+            urls = list(executor.map(lambda path: self.upload_file(path, folder_name), remaining))
+        
+        return [first_url] + urls if first_url is not None else urls
+
+    def _upload_item(self, file_path: str, item_path: str, file_size: int) -> Optional[Dict[str, Any]]:
+        """Upload file content to an item path.
+        
+        Args:
+            file_path: Local path of the file to upload
+            item_path: Destination path in OneDrive (e.g., "folder/file.pdf")
+            file_size: Size of the file in bytes
+            
+        Returns:
+            dict: Drive item of the uploaded file, or None if the parent
+            folder does not exist
+            
+        Raises:
+            Exception: If the upload fails for any other reason
+        """
+        if file_size > self.SIMPLE_UPLOAD_MAX_BYTES:
+            # Large files go through a chunked upload session
+            return self._upload_in_chunks(file_path, item_path, file_size)
+        
+        # Stream the file body instead of reading it into memory
+        with open(file_path, "rb") as f:
             response = self.make_request(
-                "me/drive/root/children",
-                method="POST",
-                json={
-                    "name": folder_name,
-                    "folder": {},
-                    "@microsoft.graph.conflictBehavior": "replace"
-                }
+                f"me/drive/root:/{item_path}:/content",
+                method="PUT",
+                data=f,
+                headers={"Content-Length": str(file_size)}
             )
+        
+        if response.status_code == 404:
+            return None
+        if response.status_code not in [200, 201]:
+            raise Exception(f"Upload failed: {response.text}")
+        
+        return response_json(response)
+
+    def _upload_in_chunks(self, file_path: str, item_path: str, file_size: int) -> Optional[Dict[str, Any]]:
+        """Upload a large file through a Graph upload session.
+        
+        The file is streamed in UPLOAD_CHUNK_SIZE pieces, so memory use stays
+        constant regardless of file size.
+        
+        Args:
+            file_path: Local path of the file to upload
+            item_path: Destination path in OneDrive (e.g., "folder/file.pdf")
+            file_size: Size of the file in bytes
             
-            if response.status_code not in [200, 201]:
-                raise Exception(f"Failed to create folder: {response.text}")
+        Returns:
+            dict: Drive item of the uploaded file, or None if the parent
+            folder does not exist
+            
+        Raises:
+            Exception: If the session cannot be created or a chunk fails
+        """
+        response = self.make_request(
+            f"me/drive/root:/{item_path}:/createUploadSession",
+            method="POST",
+            json={"item": {"@microsoft.graph.conflictBehavior": "replace"}}
+        )
+        
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise Exception(f"Failed to create upload session: {response.text}")
+        
+        upload_url = response_json(response)["uploadUrl"]
+        
+        with open(file_path, "rb") as f:
+            start = 0
+            while start < file_size:
+                chunk = f.read(self.UPLOAD_CHUNK_SIZE)
+                end = start + len(chunk) - 1
+                
+                # The upload URL is pre-authorized; no bearer token is sent
+                response = self._send(
+                    "PUT",
+                    upload_url,
+                    data=chunk,
+                    headers={
+                        "Content-Length": str(len(chunk)),
+                        "Content-Range": f"bytes {start}-{end}/{file_size}",
+                    }
+                )
+                
+                if response.status_code not in [200, 201, 202]:
+                    raise Exception(f"Upload failed at bytes {start}-{end}: {response.text}")
+                
+                start = end + 1
+        
+        # The final chunk's response carries the completed drive item
+        return response_json(response)
+
+    def _create_folder(self, folder_name: str) -> None:
+        """Create a folder in the OneDrive root.
+        
+        Args:
+            folder_name: Name of the folder to create
+        """
+        response = self.make_request(
+            "me/drive/root/children",
+            method="POST",
+            json={
+                "name": folder_name,
+                "folder": {},
+                "@microsoft.graph.conflictBehavior": "replace"
+            }
+        )
+        
+        if response.status_code not in [200, 201]:
+            raise Exception(f"Failed to create folder: {response.text}")
+
+    def _conditional_get(self, endpoint: str) -> Tuple[requests.Response, Any]:
+        """GET a metadata endpoint, revalidating a cached body by ETag.
+        
+        Sends If-None-Match with the last ETag seen for the endpoint, so an
+        unchanged resource comes back as an empty 304 instead of a full body.
+        
+        Args:
+            endpoint: API endpoint (relative to base_url)
+            
+        Returns:
+            tuple: (response, parsed JSON body or None if the request failed)
+        """
+        cached = self._etag_cache.get(endpoint)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        
+        response = self.make_request(endpoint, headers=headers)
         
-        elif response.status_code != 200:
-            raise Exception(f"Error checking folder: {response.text}")
+        if response.status_code == 304 and cached:
+            return response, cached[1]
+        if response.status_code != 200:
+            return response, None
+        
+        data = response_json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[endpoint] = (etag, data)
+        return response, data
 
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """Get information about a file in OneDrive.
@@ -393,14 +676,14 @@ class OneDriveClient:
         Returns:
             dict: File information from Microsoft Graph API
         """
-        response = self.make_request(f"me/drive/root:/{file_path}")
+        response, data = self._conditional_get(f"me/drive/root:/{file_path}")
         
         if response.status_code == 404:
             raise Exception(f"File not found: {file_path}")
-        elif response.status_code != 200:
+        elif data is None:
             raise Exception(f"Error getting file info: {response.text}")
         
-        return response.json()
+        return data
 
     def list_files(self, folder_name: str = None) -> list[Dict[str, Any]]:
         """List files in OneDrive.
@@ -411,14 +694,125 @@ class OneDriveClient:
         Returns:
             list: List of file information dictionaries
         """
-        if folder_name:
-            endpoint = f"me/drive/root:/{folder_name}:/children"
-        else:
-            endpoint = "me/drive/root/children"
-        
-        response = self.make_request(endpoint)
+        response, data = self._conditional_get(self._children_endpoint(folder_name))
         
-        if response.status_code != 200:
+        if data is None:
             raise Exception(f"Error listing files: {response.text}")
         
-        return response.json().get("value", [])
+        return data.get("value", [])
+
+    def list_folders(self, folder_names: List[Optional[str]]) -> List[list[Dict[str, Any]]]:
+        """List several OneDrive folders with one $batch round-trip.
+        
+        Args:
+            folder_names: Folder names to list; None lists the root folder
+            
+        Returns:
+            list: One list of file information dictionaries per folder, in
+            the order requested
+        """
+        if len(folder_names) == 1:
+            return [self.list_files(folder_names[0])]
+        
+        responses = self.batch([
+            {"method": "GET", "url": f"/{self._children_endpoint(folder_name)}"}
+            for folder_name in folder_names
+        ])
+        
+        listings = []
+        for folder_name, response in zip(folder_names, responses):
+            if response.get("status") != 200:
+                raise Exception(
+                    f"Error listing files in {folder_name or 'root'}: {response.get('body')}"
+                )
+            listings.append(response["body"].get("value", []))
+        return listings
+
+    def batch(self, requests_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send Graph API requests together through the JSON $batch endpoint.
+        
+        Requests are sent BATCH_MAX_REQUESTS at a time, so N independent
+        calls cost ceil(N / 20) round-trips instead of N. Sub-requests that
+        Graph throttles individually (429/503) are resent, after their
+        Retry-After delay, up to max_retries times.
+        
+        Args:
+            requests_list: Batch request dictionaries with "method" and "url"
+                (relative to the API version, e.g. "/me/drive/root/children")
+                and optionally "id", "headers", "body" and "dependsOn". Ids
+                default to each request's position in the list.
+            
+        Returns:
+            list: Batch response dictionaries ("id", "status", "headers",
+            "body"), in the same order as requests_list
+            
+        Raises:
+            Exception: If a $batch call itself fails or Graph leaves a
+            sub-request out of its responses
+        """
+        requests_list = [
+            {**request, "id": str(request.get("id", index))}
+            for index, request in enumerate(requests_list)
+        ]
+        
+        responses_by_id: Dict[str, Dict[str, Any]] = {}
+        pending = requests_list
+        for attempt in range(self.max_retries + 1):
+            for start in range(0, len(pending), self.BATCH_MAX_REQUESTS):
+                chunk = pending[start:start + self.BATCH_MAX_REQUESTS]
+                response = self.make_request("$batch", method="POST", json={"requests": chunk})
+                
+                if response.status_code != 200:
+                    raise Exception(f"Batch request failed: {response.text}")
+                
+                # Graph may answer the requests of a batch in any order
+                for item in response_json(response).get("responses", []):
+                    responses_by_id[str(item.get("id"))] = item
+            
+            throttled = [
+                request for request in pending
+                if responses_by_id.get(request["id"], {}).get("status") in (429, 503)
+            ]
+            if not throttled or attempt == self.max_retries:
+                break
+            
+            wait_time = max(
+                retry_after_from_headers(
+                    responses_by_id[request["id"]].get("headers"),
+                    default=backoff_delay(attempt, self.retry_delays),
+                )
+                for request in throttled
+            )
+            print(f"⚠️  OneDrive throttled {len(throttled)} batch request(s), retrying in {wait_time:.1f} seconds...")
+            time.sleep(wait_time)
+            pending = self._without_settled_dependencies(throttled)
+        
+        missing = [request["id"] for request in requests_list if request["id"] not in responses_by_id]
+        if missing:
+            raise Exception(f"Batch response missing for request id(s): {', '.join(missing)}")
+        
+        return [responses_by_id[request["id"]] for request in requests_list]
+
+    @staticmethod
+    def _without_settled_dependencies(requests_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop dependsOn ids that are not part of a resent batch.
+        
+        Graph rejects a batch whose requests depend on ids it does not
+        contain; dependencies that already completed need no ordering.
+        """
+        ids = {request["id"] for request in requests_list}
+        resent = []
+        for request in requests_list:
+            depends_on = [dep for dep in request.get("dependsOn", []) if dep in ids]
+            request = {key: value for key, value in request.items() if key != "dependsOn"}
+            if depends_on:
+                request["dependsOn"] = depends_on
+            resent.append(request)
+        return resent
+
+    @staticmethod
+    def _children_endpoint(folder_name: Optional[str]) -> str:
+        """Return the children endpoint for a folder name (None for root)."""
+        if folder_name:
+            return f"me/drive/root:/{folder_name}:/children"
+        return "me/drive/root/children"
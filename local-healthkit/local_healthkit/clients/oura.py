@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 
 from .base.api_key_auth import APIKeyAuthBase
 from .base.config import ClientFactory
+from .base.json_utils import response_json
 
 
 class OuraClient(APIKeyAuthBase):
@@ -58,7 +59,7 @@ class OuraClient(APIKeyAuthBase):
                 "end_date": api_end_date.strftime("%Y-%m-%d"),
             },
         )
-        return response.json()
+        return response_json(response)
 
     def get_resilience_data(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Get resilience data for a date range.
@@ -77,7 +78,7 @@ class OuraClient(APIKeyAuthBase):
                 "end_date": end_date.strftime("%Y-%m-%d"),
             },
         )
-        return response.json()
+        return response_json(response)
 
     def get_workouts(
         self, 
@@ -107,7 +108,7 @@ class OuraClient(APIKeyAuthBase):
             endpoint="usercollection/workout",
             params=params,
         )
-        return response.json()
+        return response_json(response)
 
     def get_personal_info(self) -> Dict[str, Any]:
         """Get personal information from Oura API.
@@ -116,7 +117,7 @@ class OuraClient(APIKeyAuthBase):
             Dictionary containing personal information
         """
         response = self.make_request(endpoint="usercollection/personal_info")
-        return response.json()
+        return response_json(response)
 
     def get_sleep_data(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Get sleep data for a date range.
@@ -135,7 +136,7 @@ class OuraClient(APIKeyAuthBase):
                 "end_date": end_date.strftime("%Y-%m-%d"),
             },
         )
-        return response.json()
+        return response_json(response)
 
     def get_readiness_data(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Get readiness data for a date range.
@@ -154,4 +155,4 @@ class OuraClient(APIKeyAuthBase):
                 "end_date": end_date.strftime("%Y-%m-%d"),
             },
         )
-        return response.json()
+        return response_json(response)
@@ -1,5 +1,6 @@
 """Whoop API client using authlib for OAuth2 authentication."""
 
+import itertools
 import os
 from datetime import datetime, timedelta
 from typing import Any, Dict
@@ -10,6 +11,7 @@ from .base.oauth2_auth_base import (
     SlidingWindowValidator
 )
 from .base.config import ClientFactory
+from .base.json_utils import response_json
 
 
 class WhoopClient(OAuth2AuthBase):
@@ -67,6 +69,7 @@ class WhoopClient(OAuth2AuthBase):
         self.token = None
         if hasattr(self.session, 'token'):
             self.session.token = None
+        self._invalidate_auth_cache()
 
     def _paginated_request(
         self, 
@@ -90,16 +93,20 @@ class WhoopClient(OAuth2AuthBase):
         """
         # Adjust end date if required by endpoint
         api_end = end_date + timedelta(days=1) if adjust_end_date else end_date
+        # Format the bounds once; strftime ignores tzinfo, so aware and naive
+        # datetimes both produce the YYYY-MM-DDTHH:MM:SSZ form Whoop expects
+        start_param = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_param = api_end.strftime("%Y-%m-%dT%H:%M:%SZ")
         
-        all_records = []
+        pages: list[list[dict[str, Any]]] = []
         next_token = None
         page_count = 0
         
         while True:
             page_count += 1
             params = {
-                "start": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "end": api_end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "start": start_param,
+                "end": end_param,
                 "limit": limit,
             }
             
@@ -107,10 +114,9 @@ class WhoopClient(OAuth2AuthBase):
                 params["nextToken"] = next_token
             
             response = self.make_request(endpoint, params=params)
-            data = response.json()
+            data = response_json(response)
             
-            records = data.get("records", [])
-            all_records.extend(records)
+            pages.append(data.get("records", []))
             
             # Check if there are more pages
             next_token = data.get("next_token")
@@ -118,7 +124,7 @@ class WhoopClient(OAuth2AuthBase):
                 break
         
         return {
-            "records": all_records,
+            "records": list(itertools.chain.from_iterable(pages)),
             "next_token": None
         }
 
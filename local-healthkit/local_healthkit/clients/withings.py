@@ -1,10 +1,11 @@
 """Withings API client using authlib for OAuth2 authentication."""
 
+import itertools
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
-import requests
 from .base.oauth2_auth_base import (
     OAuth2AuthBase, 
     TokenFileManager, 
@@ -12,6 +13,9 @@ from .base.oauth2_auth_base import (
     WithingsErrorStrategy
 )
 from .base.config import ClientFactory
+from .base.http import configure_session
+from .base.json_utils import response_json
+from .base.rate_limit import TokenBucket
 
 
 class WithingsClient(OAuth2AuthBase):
@@ -89,9 +93,13 @@ class WithingsClient(OAuth2AuthBase):
             redirect_uri=self.redirect_uri,
             scope=self.withings_scopes  # Use comma-separated scopes
         )
+        configure_session(self.session, max_retries=0)
         
         # Use Withings-specific error handling strategy
         self.error_strategy = WithingsErrorStrategy()
+        
+        # Withings allows 120 requests/minute per application
+        self.rate_limiter = TokenBucket(rate=2.0, capacity=10)
 
     def get_token_status(self) -> dict:
         """Get token status using shared utilities.
@@ -122,6 +130,7 @@ class WithingsClient(OAuth2AuthBase):
         self.token = None
         if hasattr(self.session, 'token'):
             self.session.token = None
+        self._invalidate_auth_cache()
 
     def _exchange_code_for_token(self, code: str, state: str) -> dict:
         """Exchange authorization code for access token using Withings-specific format.
@@ -164,12 +173,13 @@ class WithingsClient(OAuth2AuthBase):
             "redirect_uri": self.redirect_uri,
         }
         
-        response = requests.post(self.token_endpoint, data=token_data)
+        response = self.session.post(self.token_endpoint, data=token_data, withhold_token=True)
         response.raise_for_status()
-        token_response = response.json()
+        token_response = response_json(response)
         
         # Use strategy to validate and extract token data
-        return self.error_strategy.validate_token_response(token_response, "token exchange")
+        token = self.error_strategy.validate_token_response(token_response, "token exchange")
+        return self._with_expires_at(token)
 
     # _is_authentication_error override removed - now handled by WithingsErrorStrategy
 
@@ -209,12 +219,30 @@ class WithingsClient(OAuth2AuthBase):
             "refresh_token": self.token['refresh_token'],
         }
         
-        response = requests.post(self.token_endpoint, data=refresh_data)
+        response = self.session.post(self.token_endpoint, data=refresh_data, withhold_token=True)
         response.raise_for_status()
-        token_response = response.json()
+        token_response = response_json(response)
         
         # Use strategy to validate and extract token data
-        return self.error_strategy.validate_token_response(token_response, "token refresh")
+        token = self.error_strategy.validate_token_response(token_response, "token refresh")
+        return self._with_expires_at(token)
+
+    @staticmethod
+    def _with_expires_at(token: dict) -> dict:
+        """Stamp an absolute expires_at on a Withings token body.
+
+        Withings only returns ``expires_in``; storing the absolute expiry lets
+        make_request refresh proactively before the token lapses.
+
+        Args:
+            token: Token dictionary from the Withings response body
+
+        Returns:
+            The same token dictionary with ``expires_at`` set
+        """
+        if "expires_in" in token:
+            token["expires_at"] = int(time.time()) + int(token["expires_in"])
+        return token
 
     def get_weight_data(
         self, start_date: datetime, end_date: datetime
@@ -226,7 +254,8 @@ class WithingsClient(OAuth2AuthBase):
             end_date: End date for weight data
 
         Returns:
-            Dict containing weight measurements and body composition data
+            Dict containing weight measurements and body composition data,
+            with measuregrps collected across all result pages
         """
         # Convert dates to Unix timestamps
         startdate = int(start_date.timestamp())
@@ -250,8 +279,19 @@ class WithingsClient(OAuth2AuthBase):
             "enddate": enddate,
         }
         
-        response = self.make_request("measure", params=params)
-        data = response.json()
+        # Withings caps each getmeas response and flags the rest with
+        # more/offset, so page through instead of holding one huge payload
+        group_pages = []
+        while True:
+            response = self.make_request("measure", params=params)
+            
+            # Status checking already decoded the body in make_request
+            body = response_json(response).get("body", {})
+            group_pages.append(body.get("measuregrps", []))
+            
+            if not body.get("more") or not body.get("offset"):
+                break
+            params["offset"] = body["offset"]
         
-        # Error checking is now handled in the make_request override
-        return data.get("body", {})
+        body["measuregrps"] = list(itertools.chain.from_iterable(group_pages))
+        return body
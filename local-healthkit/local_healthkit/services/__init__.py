@@ -15,16 +15,33 @@ Services provide:
 - Multi-data type support
 """
 
-from .base import BaseAPIService
-from .oura import OuraService
-from .hevy import HevyService
-from .whoop import WhoopService
-from .withings import WithingsService
-from .onedrive import OneDriveService
-from .nutrition import NutritionService
+from typing import TYPE_CHECKING
+
+from .._lazy import make_lazy_getattr
+from .base import BaseAPIService, LazyFetchResult
+
+# Services are imported on first attribute access (PEP 562), so using one
+# service does not import every provider's client and its dependencies
+_LAZY_IMPORTS = {
+    "OuraService": ".oura",
+    "HevyService": ".hevy",
+    "WhoopService": ".whoop",
+    "WithingsService": ".withings",
+    "OneDriveService": ".onedrive",
+    "NutritionService": ".nutrition",
+}
+
+if TYPE_CHECKING:
+    from .oura import OuraService
+    from .hevy import HevyService
+    from .whoop import WhoopService
+    from .withings import WithingsService
+    from .onedrive import OneDriveService
+    from .nutrition import NutritionService
 
 __all__ = [
     "BaseAPIService",
+    "LazyFetchResult",
     "OuraService",
     "HevyService",
     "WhoopService",
@@ -32,3 +49,6 @@ __all__ = [
     "NutritionService",
     "OneDriveService",
 ]
+
+
+__getattr__, __dir__ = make_lazy_getattr(__name__, globals(), _LAZY_IMPORTS)
@@ -5,9 +5,83 @@ defining the common interface and shared functionality.
 """
 
 from abc import ABC
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 import logging
+import threading
+
+
+# Day boundaries used by convert_dates_to_datetime, built once at import
+_DAY_START = datetime.min.time()
+_DAY_END = datetime.max.time().replace(microsecond=0)
+
+
+class LazyFetchResult(Mapping):
+    """Read-only mapping whose values are fetched on first access.
+    
+    Lets callers that only need some data types pay only for those requests.
+    Accessing a key runs its fetcher once and caches the result; iterating
+    values or items fetches everything still missing concurrently.
+    """
+    
+    def __init__(self, fetchers: Dict[str, Callable[[], Any]], max_workers: int = 4):
+        """Initialize the lazy result.
+        
+        Args:
+            fetchers: Zero-argument callables keyed by data type name
+            max_workers: Thread pool size used when fetching all keys
+        """
+        self._fetchers = dict(fetchers)
+        self._results: Dict[str, Any] = {}
+        self._max_workers = max_workers
+        # One lock per key, so racing readers wait for the first fetch
+        # instead of repeating the request
+        self._locks = {key: threading.Lock() for key in self._fetchers}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._results:
+            fetcher = self._fetchers[key]  # KeyError for unknown data types
+            with self._locks[key]:
+                if key not in self._results:
+                    self._results[key] = fetcher()
+        return self._results[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fetchers)
+    
+    def __len__(self) -> int:
+        return len(self._fetchers)
+    
+    def __repr__(self) -> str:
+        fetched = ", ".join(self._results) or "nothing"
+        return f"<{self.__class__.__name__} keys={list(self._fetchers)} fetched={fetched}>"
+    
+    def is_fetched(self, key: str) -> bool:
+        """Check whether a data type has already been fetched."""
+        return key in self._results
+    
+    def fetch_all(self) -> Dict[str, Any]:
+        """Fetch every missing data type concurrently.
+        
+        Returns:
+            Plain dictionary with all results
+        """
+        missing = [key for key in self._fetchers if key not in self._results]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(missing))) as executor:
+                # Go through __getitem__ so each key is still fetched only once
+                list(executor.map(self.__getitem__, missing))
+        return {key: self[key] for key in self._fetchers}
+    
+    def values(self):
+        self.fetch_all()
+        return super().values()
+    
+    def items(self):
+        self.fetch_all()
+        return super().items()
 
 
 class BaseAPIService(ABC):
@@ -69,11 +143,11 @@ class BaseAPIService(ABC):
         end_datetime = None
         
         if start_date:
-            start_datetime = datetime.combine(start_date, datetime.min.time())
+            start_datetime = datetime.combine(start_date, _DAY_START)
         
         if end_date:
             # For end dates, use end of day to be inclusive
-            end_datetime = datetime.combine(end_date, datetime.max.time().replace(microsecond=0))
+            end_datetime = datetime.combine(end_date, _DAY_END)
         
         return start_datetime, end_datetime
     
@@ -81,7 +155,7 @@ class BaseAPIService(ABC):
         self, 
         endpoint: str, 
         params: Optional[Dict[str, Any]] = None, 
-        response_size: Optional[int] = None
+        response_size: Any = None
     ) -> None:
         """Log API call details for debugging and monitoring.
         
@@ -90,13 +164,22 @@ class BaseAPIService(ABC):
             params: Parameters sent with the request
             response_size: Size of the response (number of records, bytes, etc.)
         """
-        log_msg = f"API call to {endpoint}"
+        # Skip building the message entirely when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Lazy %-style args: formatting happens only if a handler emits it
+        log_msg = "API call to %s"
+        args = [endpoint]
         if params:
-            log_msg += f" with params: {params}"
+            log_msg += " with params: %s"
+            args.append(params)
         if response_size is not None:
-            log_msg += f" returned {response_size} items"
+            # %s, not %d: sizes may be record counts, byte counts or floats
+            log_msg += " returned %s items"
+            args.append(response_size)
         
-        self.logger.info(log_msg)
+        self.logger.info(log_msg, *args)
     
     def handle_api_error(self, error: Exception, endpoint: str) -> None:
         """Handle and log API errors consistently.
@@ -108,18 +191,22 @@ class BaseAPIService(ABC):
         Raises:
             The original exception after logging
         """
-        self.logger.error(f"API call to {endpoint} failed: {str(error)}")
+        self.logger.error("API call to %s failed: %s", endpoint, error)
         raise error
     
     def is_authenticated(self) -> bool:
         """Check if the underlying client is authenticated.
         
+        Not cached here: clients that cache their own checks bound them by
+        the real token expiry, and a service-level cache could not.
+        
         Returns:
             True if client is authenticated, False otherwise
         """
-        if hasattr(self.client, 'is_authenticated'):
-            return self.client.is_authenticated()
-        return True  # Assume authenticated if method not available
+        if not hasattr(self.client, 'is_authenticated'):
+            return True  # Assume authenticated if method not available
+        
+        return self.client.is_authenticated()
     
     def get_service_info(self) -> Dict[str, Any]:
         """Get information about this service.
@@ -5,8 +5,10 @@ API key authentication rather than OAuth. Despite this difference, the service
 follows the same architectural patterns as other API services in the system.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from .base import BaseAPIService
 from ..clients.hevy import HevyClient
@@ -28,29 +30,21 @@ class HevyService(BaseAPIService):
         self.hevy_client = HevyClient(page_size=page_size)
         super().__init__(self.hevy_client)
 
-    def is_authenticated(self) -> bool:
-        """Check if the service is authenticated.
-        
-        Returns:
-            True if API key is available, False otherwise
-        """
-        return self.hevy_client.is_authenticated()
-
     def get_workouts_data(
         self, 
         start_date: Optional[datetime] = None, 
         end_date: Optional[datetime] = None,
-        page_size: int = 10
+        page_size: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Get workouts data from Hevy API.
+        """Get workouts data from Hevy API across all pages.
 
         Args:
             start_date: Start date for filtering (applied client-side)
             end_date: End date for filtering (applied client-side)
-            page_size: Number of workouts per page
+            page_size: Number of workouts per page (client default if None)
 
         Returns:
-            Raw API response containing workout data
+            Raw API response containing workout data from every page in range
         """
         return self.hevy_client.get_workouts(start_date, end_date, page_size)
 
@@ -65,7 +59,61 @@ class HevyService(BaseAPIService):
         """
         return self.hevy_client.get_workout_details(workout_id)
 
-
+    def get_workout_details_bulk_sync(
+        self,
+        workout_ids: List[str],
+        concurrency: int = 20
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Fetch details for many workouts concurrently.
+        
+        Avoids one serial round trip per workout. Requests run on a thread
+        pool sharing the client's pooled session and rate limiter, with at
+        most ``concurrency`` in flight. Works from synchronous code and from
+        inside a running event loop alike.
+        
+        Args:
+            workout_ids: IDs of the workouts to fetch
+            concurrency: Maximum number of simultaneous requests
+            
+        Returns:
+            Workout details in the same order as workout_ids; a failed fetch
+            is returned as its exception instead of aborting the batch
+        """
+        if not workout_ids:
+            return []
+        
+        def fetch(workout_id):
+            try:
+                return self.get_workout_details(workout_id)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(workout_ids))) as executor:
+            results = list(executor.map(fetch, workout_ids))
+        
+        failures = sum(isinstance(result, Exception) for result in results)
+        if failures:
+            self.logger.warning("%d of %d workout detail fetches failed", failures, len(workout_ids))
+        return results
+
+    async def get_workout_details_bulk(
+        self,
+        workout_ids: List[str],
+        concurrency: int = 20
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Fetch details for many workouts without blocking the event loop.
+        
+        Runs get_workout_details_bulk_sync on a worker thread, so both entry
+        points share one fan-out and one concurrency limit.
+        
+        Args:
+            workout_ids: IDs of the workouts to fetch
+            concurrency: Maximum number of simultaneous requests
+            
+        Returns:
+            Workout details (or exceptions) in the same order as workout_ids
+        """
+        return await asyncio.to_thread(self.get_workout_details_bulk_sync, workout_ids, concurrency)
 
     def fetch_data(
         self, 
@@ -90,7 +138,7 @@ class HevyService(BaseAPIService):
         # Fetch all data types
         data = {}
         
-        data['workouts'] = self.get_workouts_data(start_datetime, end_datetime, page_size=10)
+        data['workouts'] = self.get_workouts_data(start_datetime, end_datetime)
         self.log_api_call('workouts', {'start': start_date, 'end': end_date}, 
                         len(data['workouts'].get('workouts', [])))
         
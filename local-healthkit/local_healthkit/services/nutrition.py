@@ -5,12 +5,17 @@ following the same architectural patterns as other API services in the system.
 """
 
 from datetime import date, datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from .base import BaseAPIService
 from ..clients.nutrition import NutritionClient
 
 
+def _to_date(value: Optional[Union[date, datetime]]) -> Optional[date]:
+    """Normalize a datetime to its date; dates and None pass through."""
+    return value.date() if isinstance(value, datetime) else value
+
+
 class NutritionService(BaseAPIService):
     """Service for nutrition data communication.
     
@@ -18,14 +23,23 @@ class NutritionService(BaseAPIService):
     all actual file reading to the NutritionClient.
     """
 
-    def __init__(self, data_dir: str = "data", filename: str = "dailysummary.csv"):
+    def __init__(
+        self,
+        data_dir: str = "data",
+        filename: str = "dailysummary.csv",
+        cache_format: Optional[str] = None
+    ):
         """Initialize the NutritionService.
 
         Args:
             data_dir: Directory containing the nutrition CSV file
             filename: Name of the nutrition data CSV file
+            cache_format: Optional columnar mirror of the CSV ("parquet" or
+                "feather"); see NutritionClient
         """
-        self.nutrition_client = NutritionClient(data_dir=data_dir, filename=filename)
+        self.nutrition_client = NutritionClient(
+            data_dir=data_dir, filename=filename, cache_format=cache_format
+        )
         super().__init__(self.nutrition_client)
     
     def fetch_data(self, start_date: date, end_date: date) -> Dict[str, Any]:
@@ -34,12 +48,13 @@ class NutritionService(BaseAPIService):
         This method follows the standard service interface used by all services.
         
         Args:
-            start_date: Start date for data retrieval
-            end_date: End date for data retrieval
+            start_date: Start date for data retrieval (datetimes are accepted)
+            end_date: End date for data retrieval (datetimes are accepted)
             
         Returns:
             Dictionary containing nutrition data in the expected format
         """
+        start_date, end_date = _to_date(start_date), _to_date(end_date)
         self.logger.info(f"Fetching nutrition data from {start_date} to {end_date}")
         
         try:
@@ -65,8 +80,4 @@ class NutritionService(BaseAPIService):
         Returns:
             Dictionary containing nutrition data in the expected format
         """
-        # Convert datetime to date for the client
-        start_dt = start_date.date() if hasattr(start_date, 'date') else start_date
-        end_dt = end_date.date() if hasattr(end_date, 'date') else end_date
-        
-        return self.fetch_data(start_dt, end_dt)
+        return self.fetch_data(start_date, end_date)
@@ -1,7 +1,9 @@
 """OneDrive API service for cloud storage operations."""
 
+import asyncio
+import os
 from datetime import date
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from .base import BaseAPIService
 from ..clients.onedrive import OneDriveClient
@@ -14,18 +16,54 @@ class OneDriveService(BaseAPIService):
     all actual API communication to the existing OneDriveClient.
     """
 
+    # Default cap on Graph calls in flight across this service's coroutines;
+    # override with ONEDRIVE_MAX_CONCURRENCY
+    DEFAULT_MAX_CONCURRENCY = 8
+
     def __init__(self):
         """Initialize the OneDrive service."""
         self.onedrive_client = OneDriveClient()
         super().__init__(self.onedrive_client)
-
-    def is_authenticated(self) -> bool:
-        """Check if the service is authenticated.
         
-        Returns:
-            True if authenticated, False otherwise
+        self.max_concurrency = self._max_concurrency_from_env()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _max_concurrency_from_env(self) -> int:
+        """Read ONEDRIVE_MAX_CONCURRENCY, falling back to the default if invalid."""
+        value = os.getenv("ONEDRIVE_MAX_CONCURRENCY")
+        if value is None:
+            return self.DEFAULT_MAX_CONCURRENCY
+        try:
+            max_concurrency = int(value)
+        except ValueError:
+            max_concurrency = 0
+        if max_concurrency < 1:
+            self.logger.warning(
+                "Invalid ONEDRIVE_MAX_CONCURRENCY %r, using %d",
+                value, self.DEFAULT_MAX_CONCURRENCY,
+            )
+            return self.DEFAULT_MAX_CONCURRENCY
+        return max_concurrency
+
+    def _graph_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding Graph calls on the running event loop.
+
+        One semaphore is shared by every async method, so uploads and
+        listings fanned out together stay under the cap instead of
+        triggering Graph throttling. It is recreated if the service is used
+        from a new event loop.
         """
-        return self.onedrive_client.is_authenticated()
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run_graph_call(self, func, *args):
+        """Run a blocking Graph call on a worker thread under the concurrency cap."""
+        async with self._graph_semaphore():
+            return await asyncio.to_thread(func, *args)
 
     def create_folder(self, folder_name: str, parent_folder_id: str = None) -> Dict[str, Any]:
         """Create a folder in OneDrive.
@@ -51,6 +89,47 @@ class OneDriveService(BaseAPIService):
         """
         return self.onedrive_client.upload_file(file_path, remote_path)
 
+    async def upload_file_async(self, file_path: str, remote_path: str) -> Dict[str, Any]:
+        """Upload a file to OneDrive without blocking the event loop.
+
+        The local file read and the Graph requests both run on a worker
+        thread, so other coroutines keep running while the file uploads.
+
+        Args:
+            file_path: Local path to the file to upload
+            remote_path: Remote path where the file should be stored
+
+        Returns:
+            Raw API response containing upload result
+        """
+        return await self._run_graph_call(self.upload_file, file_path, remote_path)
+
+    async def upload_files_async(self, file_paths: List[str], remote_path: str) -> List[str]:
+        """Upload several files to OneDrive without blocking the event loop.
+
+        Each file is uploaded under its own semaphore slot, so at most
+        max_concurrency uploads run at once across the service. As in the
+        client's upload_files, the first file is uploaded alone so a missing
+        folder is created once rather than by every concurrent upload.
+
+        Args:
+            file_paths: Local paths of the files to upload
+            remote_path: Remote path where the files should be stored
+
+        Returns:
+            Shareable URLs in the same order as file_paths
+        """
+        urls = []
+        remaining = file_paths
+        if remote_path and len(file_paths) > 1:
+            urls.append(await self.upload_file_async(file_paths[0], remote_path))
+            remaining = file_paths[1:]
+        
+        urls.extend(await asyncio.gather(*(
+            self.upload_file_async(file_path, remote_path) for file_path in remaining
+        )))
+        return urls
+
     def list_files(self, folder_id: str = None) -> Dict[str, Any]:
         """List files in a OneDrive folder.
 
@@ -62,27 +141,86 @@ class OneDriveService(BaseAPIService):
         """
         return self.onedrive_client.list_files(folder_id)
 
+    def list_folders(self, folder_names: List[Optional[str]]) -> List[list]:
+        """List several OneDrive folders in one batched request.
+
+        Args:
+            folder_names: Folder names to list (None for the root folder)
+
+        Returns:
+            One raw file list per folder, in the order requested
+        """
+        return self.onedrive_client.list_folders(folder_names)
+
     def fetch_data(
         self, 
         start_date: Optional[date] = None, 
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        folder_names: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Fetch OneDrive information (not date-based).
         
         Args:
             start_date: Not used for OneDrive (included for interface consistency)
             end_date: Not used for OneDrive (included for interface consistency)
+            folder_names: Optional folders to list alongside the root folder;
+                all listings are fetched in one batched request
             
         Returns:
-            Dictionary containing OneDrive information
+            Dictionary containing OneDrive information, with a 'folders'
+            mapping of folder name to file list when folder_names is given
         """
         data = {}
         
         try:
-            data['files'] = self.list_files()
+            if folder_names:
+                data['files'], *listings = self.list_folders([None, *folder_names])
+                data['folders'] = dict(zip(folder_names, listings))
+            else:
+                data['files'] = self.list_files()
             self.log_api_call('list_files', {}, 
                             len(data['files']) if isinstance(data['files'], list) else 0)
         except Exception as e:
             self.handle_api_error(e, 'list_files')
         
         return data
+
+    async def fetch_data_async(
+        self, 
+        start_date: Optional[date] = None, 
+        end_date: Optional[date] = None,
+        folder_names: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch OneDrive information, listing many folders concurrently.
+        
+        The root and named folders are split into $batch-sized groups, and
+        the groups are requested at the same time on worker threads sharing
+        the client's pooled session. Returns the same structure as fetch_data.
+        
+        Args:
+            start_date: Not used for OneDrive (included for interface consistency)
+            end_date: Not used for OneDrive (included for interface consistency)
+            folder_names: Optional folders to list alongside the root folder
+            
+        Returns:
+            Dictionary containing OneDrive information
+        """
+        if not folder_names:
+            return await self._run_graph_call(self.fetch_data, start_date, end_date)
+        
+        names = [None, *folder_names]
+        size = self.onedrive_client.BATCH_MAX_REQUESTS
+        
+        data = {}
+        try:
+            groups = await asyncio.gather(*(
+                self._run_graph_call(self.list_folders, names[i:i + size])
+                for i in range(0, len(names), size)
+            ))
+            data['files'], *listings = [listing for group in groups for listing in group]
+            data['folders'] = dict(zip(folder_names, listings))
+            self.log_api_call('list_files', {}, len(data['files']))
+        except Exception as e:
+            self.handle_api_error(e, 'list_files')
+        
+        return data
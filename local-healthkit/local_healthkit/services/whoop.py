@@ -1,9 +1,11 @@
 """Whoop API service for clean separation of concerns."""
 
-from datetime import date, datetime
-from typing import Optional, Dict, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional, Dict, Any
 
-from .base import BaseAPIService
+from .base import BaseAPIService, LazyFetchResult
 from ..clients.whoop import WhoopClient
 
 
@@ -14,19 +16,23 @@ class WhoopService(BaseAPIService):
     all actual API communication to the existing WhoopClient.
     """
     
+    # Maximum number of endpoints fetched at the same time
+    ENDPOINT_CONCURRENCY = 4
+    
+    # (data type, service method, response key holding the records); new
+    # endpoints only need a row here
+    ENDPOINTS = (
+        ('workouts', 'get_workouts_data', 'records'),
+        ('recovery', 'get_recovery_data', 'records'),
+        ('sleep', 'get_sleep_data', 'records'),
+        ('cycles', 'get_cycles_data', 'records'),
+    )
+    
     def __init__(self):
         """Initialize the Whoop service."""
         self.whoop_client = WhoopClient()
         super().__init__(self.whoop_client)
     
-    def is_authenticated(self) -> bool:
-        """Check if the service is authenticated.
-        
-        Returns:
-            True if authenticated, False otherwise
-        """
-        return self.whoop_client.is_authenticated()
-    
     def get_workouts_data(
         self, 
         start_date: datetime, 
@@ -100,6 +106,9 @@ class WhoopService(BaseAPIService):
     ) -> Dict[str, Any]:
         """Fetch all available Whoop data for the specified date range.
         
+        The four endpoints are fetched on a thread pool, so this works from
+        synchronous code and from inside a running event loop alike.
+        
         Args:
             start_date: Start date for data collection
             end_date: End date for data collection
@@ -113,23 +122,149 @@ class WhoopService(BaseAPIService):
         # Convert dates to datetime objects
         start_datetime, end_datetime = self.convert_dates_to_datetime(start_date, end_date)
         
-        # Fetch all data types
-        data = {}
+        with ThreadPoolExecutor(max_workers=self.ENDPOINT_CONCURRENCY) as executor:
+            futures = {
+                executor.submit(fetcher, start_datetime, end_datetime): endpoint
+                for endpoint, fetcher in self._endpoint_fetchers().items()
+            }
+            results = {futures[future]: future.result() for future in as_completed(futures)}
         
-        data['workouts'] = self.get_workouts_data(start_datetime, end_datetime)
-        self.log_api_call('workouts', {'start': start_date, 'end': end_date}, 
-                        len(data['workouts'].get('records', [])))
+        # Keep the usual key order and log once everything has arrived
+        data = dict.fromkeys(endpoint for endpoint, _, _ in self.ENDPOINTS)
+        for endpoint, _, records_key in self.ENDPOINTS:
+            data[endpoint] = results[endpoint]
+            self._log_endpoint(endpoint, records_key, data[endpoint], start_date, end_date)
         
-        data['recovery'] = self.get_recovery_data(start_datetime, end_datetime)
-        self.log_api_call('recovery', {'start': start_date, 'end': end_date}, 
-                        len(data['recovery'].get('records', [])))
+        return data
+
+    def fetch_data_lazy(
+        self, 
+        start_date: Optional[date] = None, 
+        end_date: Optional[date] = None
+    ) -> LazyFetchResult:
+        """Fetch Whoop data types on demand.
         
-        data['sleep'] = self.get_sleep_data(start_datetime, end_datetime)
-        self.log_api_call('sleep', {'start': start_date, 'end': end_date}, 
-                        len(data['sleep'].get('records', [])))
+        Returns immediately; each data type is requested the first time its
+        key is read, so callers needing only e.g. sleep make one request.
+        Iterating values or items fetches the remaining types concurrently.
         
-        data['cycles'] = self.get_cycles_data(start_datetime, end_datetime)
-        self.log_api_call('cycles', {'start': start_date, 'end': end_date}, 
-                        len(data['cycles'].get('records', [])))
+        Args:
+            start_date: Start date for data collection
+            end_date: End date for data collection
+            
+        Returns:
+            Mapping with the same keys as fetch_data, fetched lazily
+        """
+        if not start_date or not end_date:
+            raise ValueError("Both start_date and end_date are required for Whoop API")
         
-        return data
+        # Convert dates to datetime objects
+        start_datetime, end_datetime = self.convert_dates_to_datetime(start_date, end_date)
+        
+        def make_fetcher(endpoint, method, records_key):
+            def fetch():
+                result = getattr(self, method)(start_datetime, end_datetime)
+                self._log_endpoint(endpoint, records_key, result, start_date, end_date)
+                return result
+            return fetch
+        
+        return LazyFetchResult(
+            {endpoint: make_fetcher(endpoint, method, records_key)
+             for endpoint, method, records_key in self.ENDPOINTS},
+            max_workers=self.ENDPOINT_CONCURRENCY,
+        )
+
+    def fetch_data_range(
+        self, 
+        start_date: date, 
+        end_date: date, 
+        chunk_days: int = 30
+    ) -> Dict[str, Any]:
+        """Fetch a long date range as a few large windows.
+        
+        Backfills should call this once instead of fetch_data per day: the
+        range is split into windows of at most ``chunk_days`` days, each
+        window fetches all four endpoints concurrently, and the records are
+        concatenated per endpoint.
+        
+        Args:
+            start_date: First day of the range (inclusive)
+            end_date: Last day of the range (inclusive)
+            chunk_days: Maximum number of days per request window
+            
+        Returns:
+            Dictionary containing all Whoop data types for the whole range.
+            Each value is synthesized in the shape of a paginated response
+            (``{"records": [...], "next_token": None}``) so extractors can
+            consume it like fetch_data output; ``next_token`` is always None
+            because every page of every window has already been fetched.
+        
+        Raises:
+            ValueError: If a date is missing or chunk_days is less than 1
+        """
+        if not start_date or not end_date:
+            raise ValueError("Both start_date and end_date are required for Whoop API")
+        if chunk_days < 1:
+            raise ValueError("chunk_days must be at least 1")
+        
+        records = {endpoint: [] for endpoint, _, _ in self.ENDPOINTS}
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=chunk_days - 1), end_date)
+            window = self.fetch_data(window_start, window_end)
+            for endpoint, _, records_key in self.ENDPOINTS:
+                records[endpoint].extend(window[endpoint].get(records_key) or ())
+            window_start = window_end + timedelta(days=1)
+        
+        return {
+            endpoint: {"records": endpoint_records, "next_token": None}
+            for endpoint, endpoint_records in records.items()
+        }
+
+    async def fetch_data_async(
+        self, 
+        start_date: Optional[date] = None, 
+        end_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """Fetch all Whoop data types without blocking the event loop.
+        
+        Runs fetch_data on a worker thread, so the four endpoints are fetched
+        by the same thread pool and under the same ENDPOINT_CONCURRENCY limit
+        as the synchronous path.
+        
+        Args:
+            start_date: Start date for data collection
+            end_date: End date for data collection
+            
+        Returns:
+            Dictionary containing all Whoop data types
+        """
+        return await asyncio.to_thread(self.fetch_data, start_date, end_date)
+
+    def _endpoint_fetchers(self) -> Dict[str, Callable[[datetime, datetime], Dict[str, Any]]]:
+        """Map each Whoop data type to the method that fetches it.
+        
+        Returns:
+            Dictionary of data type name to bound fetch method
+        """
+        return {endpoint: getattr(self, method) for endpoint, method, _ in self.ENDPOINTS}
+
+    def _log_endpoint(
+        self, 
+        endpoint: str, 
+        records_key: str, 
+        result: Dict[str, Any], 
+        start_date: date, 
+        end_date: date
+    ) -> None:
+        """Log one endpoint fetch with its record count.
+        
+        Args:
+            endpoint: Data type name
+            records_key: Response key holding the records
+            result: Raw API response
+            start_date: Requested start date
+            end_date: Requested end date
+        """
+        records = result.get(records_key) or ()
+        self.log_api_call(endpoint, {'start': start_date, 'end': end_date}, len(records))
@@ -19,14 +19,6 @@ class WithingsService(BaseAPIService):
         self.withings_client = WithingsClient()
         super().__init__(self.withings_client)
 
-    def is_authenticated(self) -> bool:
-        """Check if the service is authenticated.
-        
-        Returns:
-            True if authenticated, False otherwise
-        """
-        return self.withings_client.is_authenticated()
-
     def get_weight_data(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Get weight data for a date range.
 
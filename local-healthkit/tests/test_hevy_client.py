@@ -0,0 +1,148 @@
+"""Tests for HevyClient workout pagination."""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("requests")
+
+from local_healthkit.clients.hevy import HevyClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("HEVY_API_KEY", "test-key")
+    return HevyClient(page_size=2)
+
+
+def _serve(client, pages):
+    """Answer _fetch_workout_page from ``pages`` (page number -> response)."""
+    requested = []
+    lock = threading.Lock()
+
+    def fetch(page, page_size):
+        with lock:
+            requested.append(page)
+        return pages[page]
+
+    client._fetch_workout_page = fetch
+    return requested
+
+
+def _page(number, count=2, page_count=None):
+    data = {"workouts": [{"id": f"{number}-{i}"} for i in range(count)]}
+    if page_count is not None:
+        data["page_count"] = page_count
+    return data
+
+
+def _ids(result):
+    return [workout["id"] for workout in result["workouts"]]
+
+
+def test_page_count_walk_spans_several_batches(client):
+    pages = {n: _page(n, page_count=10) for n in range(1, 11)}
+    requested = _serve(client, pages)
+
+    result = client.get_workouts()
+
+    assert sorted(requested) == list(range(1, 11))
+    assert len(requested) == len(set(requested))
+    assert _ids(result) == [f"{n}-{i}" for n in range(1, 11) for i in range(2)]
+
+
+def test_walks_pages_until_short_page_without_page_count(client):
+    pages = {1: _page(1), 2: _page(2), 3: _page(3, count=1), 4: _page(4)}
+    requested = _serve(client, pages)
+
+    result = client.get_workouts()
+
+    assert requested == [1, 2, 3]
+    assert _ids(result) == ["1-0", "1-1", "2-0", "2-1", "3-0"]
+
+
+def test_single_short_page_without_page_count(client):
+    requested = _serve(client, {1: _page(1, count=1)})
+
+    assert _ids(client.get_workouts()) == ["1-0"]
+    assert requested == [1]
+
+
+def test_page_without_workouts_stops_the_walk(client):
+    pages = {n: _page(n, page_count=9) for n in range(1, 10)}
+    pages[3] = {"page_count": 9}
+    requested = _serve(client, pages)
+
+    result = client.get_workouts()
+
+    # Pages 4 and 5 share page 3's batch and may be fetched; no later batch is
+    assert set(requested) <= {1, 2, 3, 4, 5}
+    assert {1, 2, 3} <= set(requested)
+    assert len(requested) == len(set(requested))
+    assert _ids(result) == ["1-0", "1-1", "2-0", "2-1"]
+
+
+def test_page_without_workouts_stops_walk_without_page_count(client):
+    requested = _serve(client, {1: _page(1), 2: {}, 3: _page(3)})
+
+    assert _ids(client.get_workouts()) == ["1-0", "1-1"]
+    assert requested == [1, 2]
+
+
+# One-day range as built by BaseAPIService.convert_dates_to_datetime
+DAY_START = datetime(2024, 3, 5, 0, 0, 0)
+DAY_END = datetime(2024, 3, 5, 23, 59, 59)
+
+
+def _timed(*start_times):
+    return [{"id": value, "start_time": value} for value in start_times]
+
+
+def test_filter_keeps_bounds_widened_by_slack_inclusively():
+    workouts = _timed(
+        "2024-03-07T00:00:00Z",
+        "2024-03-06T23:59:59Z",
+        "2024-03-04T00:00:00Z",
+        "2024-03-03T23:59:59Z",
+    )
+
+    in_range, done = HevyClient._filter_workouts(workouts, DAY_START, DAY_END)
+
+    assert [w["id"] for w in in_range] == ["2024-03-06T23:59:59Z", "2024-03-04T00:00:00Z"]
+    assert done
+
+
+def test_filter_keeps_late_evening_workout_recorded_after_utc_midnight():
+    # 22:30 on March 5 in New York is 03:30 on March 6 in UTC
+    workouts = _timed("2024-03-06T03:30:00Z", "2024-03-06T03:30:00+00:00", "2024-03-06T03:30:00")
+
+    in_range, done = HevyClient._filter_workouts(workouts, DAY_START, DAY_END)
+
+    assert len(in_range) == 3
+    assert not done
+
+
+def test_filter_drops_workouts_without_start_time():
+    workouts = [{"id": "no-time"}, {"id": "empty", "start_time": ""}] + _timed("2024-03-05T12:00:00Z")
+
+    in_range, done = HevyClient._filter_workouts(workouts, DAY_START, DAY_END)
+
+    assert [w["id"] for w in in_range] == ["2024-03-05T12:00:00Z"]
+    assert not done
+
+
+def test_walk_stops_after_page_with_workout_before_start(client):
+    # Newest first: page 1 is March 6, page 2 is March 5 and ends with a
+    # workout from February, so no later batch is needed
+    pages = {n: {"workouts": _timed(f"2024-03-{7 - n:02d}T12:00:00Z"), "page_count": 10}
+             for n in range(1, 5)}
+    pages.update({n: {"workouts": _timed("2024-01-01T12:00:00Z"), "page_count": 10}
+                  for n in range(5, 11)})
+    pages[2]["workouts"] += _timed("2024-02-01T12:00:00Z")
+    requested = _serve(client, pages)
+
+    result = client.get_workouts(DAY_START, DAY_END)
+
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+    assert _ids(result) == ["2024-03-06T12:00:00Z", "2024-03-05T12:00:00Z"]
@@ -0,0 +1,45 @@
+"""Tests for the shared HTTP session setup."""
+
+import socket
+import time
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from local_healthkit.clients.base import api_key_auth
+from local_healthkit.clients.base.api_key_auth import APIKeyAuthBase
+from local_healthkit.clients.base.http import get_shared_session
+
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_shared_session_adapter_does_not_retry():
+    adapter = get_shared_session().get_adapter("https://api.example.com")
+
+    assert adapter.max_retries.total == 0
+
+
+def test_api_key_client_retries_connection_errors_once_per_attempt(monkeypatch):
+    monkeypatch.setenv("TEST_API_KEY", "key")
+    monkeypatch.setattr(api_key_auth.time, "sleep", lambda seconds: None)
+    client = APIKeyAuthBase("TEST_API_KEY", f"http://127.0.0.1:{_unused_port()}", max_retries=2)
+    attempts = []
+    send = client.session.send
+
+    def counting_send(request, **kwargs):
+        attempts.append(request.url)
+        return send(request, **kwargs)
+
+    monkeypatch.setattr(client.session, "send", counting_send)
+
+    started = time.monotonic()
+    with pytest.raises(Exception, match="after 2 retries"):
+        client.make_request("ping")
+
+    assert len(attempts) == 3
+    assert time.monotonic() - started < 5
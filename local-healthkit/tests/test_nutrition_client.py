@@ -0,0 +1,102 @@
+"""Tests for reading the Cronometer daily summary CSV."""
+
+from datetime import date
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from local_healthkit.clients.nutrition import NutritionClient
+
+HEADER = "Date,Energy (kcal),Protein (g),Carbs (g),Fat (g),Alcohol (g),Fiber (g)\n"
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "dailysummary.csv").write_text(
+        HEADER
+        + "2024-01-01,2000.4,150.26,200,70,0,30\n"
+        + "2024-01-02,1800,120,180,60,,25\n"
+        + "2024-01-03,2200,160,220,80,14,35\n"
+    )
+    return tmp_path
+
+
+def test_reads_csv_without_writing_a_mirror(data_dir):
+    client = NutritionClient(data_dir=str(data_dir))
+
+    records = client.get_nutrition_data(date(2024, 1, 2), date(2024, 1, 3))
+
+    assert [r["date"] for r in records] == ["2024-01-02", "2024-01-03"]
+    assert records[0]["alcohol"] == 0
+    assert [p.name for p in data_dir.iterdir()] == ["dailysummary.csv"]
+
+
+def test_rounds_calories_and_macros(data_dir):
+    records = NutritionClient(data_dir=str(data_dir)).get_nutrition_data()
+
+    assert records[0]["calories"] == 2000
+    assert records[0]["protein"] == 150.3
+
+
+@pytest.mark.parametrize("cache_format", ["parquet", "feather"])
+def test_columnar_mirror_matches_csv(data_dir, cache_format):
+    pytest.importorskip("pyarrow")
+    start, end = date(2024, 1, 2), date(2024, 1, 3)
+    expected = NutritionClient(data_dir=str(data_dir)).get_nutrition_data(start, end)
+
+    client = NutritionClient(data_dir=str(data_dir), cache_format=cache_format)
+
+    assert client.get_nutrition_data(start, end) == expected
+    assert (data_dir / f"dailysummary.{cache_format}").exists()
+
+
+@pytest.mark.parametrize("cache_format", ["parquet", "feather"])
+def test_mirror_is_written_without_leaving_temp_files(data_dir, cache_format):
+    pytest.importorskip("pyarrow")
+    NutritionClient(data_dir=str(data_dir), cache_format=cache_format).get_nutrition_data()
+
+    assert sorted(p.name for p in data_dir.iterdir()) == sorted(
+        ["dailysummary.csv", f"dailysummary.{cache_format}"]
+    )
+
+
+def test_failed_mirror_write_falls_back_and_cleans_up(data_dir, monkeypatch):
+    pytest.importorskip("pyarrow")
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", fail)
+    client = NutritionClient(data_dir=str(data_dir), cache_format="parquet")
+
+    assert len(client.get_nutrition_data()) == 3
+    assert [p.name for p in data_dir.iterdir()] == ["dailysummary.csv"]
+
+
+def test_rejects_unknown_cache_format(data_dir):
+    with pytest.raises(ValueError):
+        NutritionClient(data_dir=str(data_dir), cache_format="orc")
+
+
+@pytest.fixture
+def dirty_data_dir(tmp_path):
+    (tmp_path / "dailysummary.csv").write_text(
+        HEADER
+        + "2024-01-01,2000,150,200,70,0,30\n"
+        + "2024-01-02,—,120,180,60,0,25\n"
+        + "2024-01-03,\"1,234\",160,220,80,14,35\n"
+    )
+    return tmp_path
+
+
+@pytest.mark.parametrize("cache_format", [None, "parquet"])
+def test_non_numeric_cells_become_zero(dirty_data_dir, cache_format):
+    if cache_format:
+        pytest.importorskip("pyarrow")
+    client = NutritionClient(data_dir=str(dirty_data_dir), cache_format=cache_format)
+
+    records = client.get_nutrition_data()
+
+    assert [r["calories"] for r in records] == [2000, 0, 0]
+    assert [r["protein"] for r in records] == [150, 120, 160]
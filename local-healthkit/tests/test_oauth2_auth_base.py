@@ -0,0 +1,171 @@
+"""Tests for the shared OAuth2 client helpers."""
+
+import threading
+import time
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("authlib")
+
+from local_healthkit.clients.base.oauth2_auth_base import (
+    OAuth2AuthBase,
+    StandardHttpErrorStrategy,
+    load_token_file,
+    write_token_file,
+)
+
+
+class RotatingClient(OAuth2AuthBase):
+    """OAuth2 client whose refresh returns a rotated refresh token."""
+
+    def _refresh_access_token(self) -> dict:
+        return {
+            "access_token": "new-access",
+            "refresh_token": "rotated-refresh",
+            "token_type": "Bearer",
+            "expires_at": int(time.time()) + 3600,
+        }
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEST_CLIENT_ID", "id")
+    monkeypatch.setenv("TEST_CLIENT_SECRET", "secret")
+    return RotatingClient(
+        env_client_id="TEST_CLIENT_ID",
+        env_client_secret="TEST_CLIENT_SECRET",
+        token_file=str(tmp_path / "tokens.json"),
+        base_url="https://api.example.com",
+        authorization_endpoint="https://auth.example.com/authorize",
+        token_endpoint="https://auth.example.com/token",
+        scopes=["read"],
+    )
+
+
+def _http_error(status_code, body):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    return requests.HTTPError("400 Client Error: Bad Request", response=response)
+
+
+def test_json_error_body_is_authentication_error():
+    error = _http_error(400, b'{"error": "invalid_token"}')
+    assert StandardHttpErrorStrategy().is_authentication_error(error)
+
+
+def test_unrelated_json_error_body_is_not_authentication_error():
+    error = _http_error(400, b'{"error": "bad_request"}')
+    assert not StandardHttpErrorStrategy().is_authentication_error(error)
+
+
+def test_non_json_error_body_is_not_authentication_error():
+    error = _http_error(400, b"<html>Bad Request</html>")
+    assert not StandardHttpErrorStrategy().is_authentication_error(error)
+
+
+def test_refreshed_token_is_on_disk_when_refresh_returns(client):
+    client.set_token({"access_token": "old-access", "refresh_token": "old-refresh",
+                      "token_type": "Bearer", "expires_at": int(time.time()) - 10})
+
+    assert client.refresh_token_if_needed(force=True)
+
+    saved = load_token_file(client.token_file)
+    assert saved["refresh_token"] == "rotated-refresh"
+    assert saved["access_token"] == "new-access"
+    assert "sliding_window_expires_at" in saved
+
+
+def test_new_client_loads_refreshed_token(client):
+    client.set_token({"access_token": "old-access", "refresh_token": "old-refresh",
+                      "token_type": "Bearer", "expires_at": int(time.time()) - 10})
+    client.refresh_token_if_needed(force=True)
+
+    reloaded = RotatingClient(
+        env_client_id="TEST_CLIENT_ID",
+        env_client_secret="TEST_CLIENT_SECRET",
+        token_file=client.token_file,
+        base_url=client.base_url,
+        authorization_endpoint=client.authorization_endpoint,
+        token_endpoint=client.token_endpoint,
+        scopes=client.scopes,
+    )
+    assert reloaded.token["refresh_token"] == "rotated-refresh"
+    assert reloaded.is_authenticated()
+
+
+def test_write_token_file_replaces_atomically(tmp_path):
+    path = str(tmp_path / "tokens.json")
+    write_token_file(path, {"access_token": "first"})
+    write_token_file(path, {"access_token": "second"})
+
+    assert load_token_file(path) == {"access_token": "second"}
+    assert [p.name for p in tmp_path.iterdir()] == ["tokens.json"]
+
+
+def test_concurrent_token_writers_do_not_collide(tmp_path):
+    path = str(tmp_path / "tokens.json")
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(20):
+                write_token_file(path, {"writer": n, "i": i})
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert load_token_file(path)["i"] == 19
+    assert [p.name for p in tmp_path.iterdir()] == ["tokens.json"]
+
+
+def test_refresh_decided_before_another_thread_refreshes_posts_once(client, monkeypatch):
+    client.set_token({"access_token": "old-access", "refresh_token": "old-refresh",
+                      "token_type": "Bearer", "expires_at": int(time.time()) - 10})
+    posts = []
+
+    def post(url, data=None, **kwargs):
+        posts.append(data["refresh_token"])
+        response = requests.Response()
+        response.status_code = 200
+        response._content = (
+            b'{"access_token": "new-access", "refresh_token": "rotated-refresh",'
+            b' "token_type": "Bearer", "expires_in": 3600}'
+        )
+        return response
+
+    monkeypatch.setattr(client.session, "post", post)
+    monkeypatch.setattr(RotatingClient, "_refresh_access_token",
+                        OAuth2AuthBase._refresh_access_token)
+
+    # The second thread decides to refresh while the old token is current,
+    # then resumes only after the first thread has swapped in a new one
+    decided = threading.Event()
+    refreshed = threading.Event()
+
+    def is_in_sliding_window():
+        if threading.current_thread() is not threading.main_thread():
+            decided.set()
+            refreshed.wait(timeout=5)
+        return False
+
+    monkeypatch.setattr(client, "is_in_sliding_window", is_in_sliding_window)
+    results = []
+    late = threading.Thread(target=lambda: results.append(client.refresh_token_if_needed()))
+    late.start()
+    assert decided.wait(timeout=5)
+
+    assert client.refresh_token_if_needed()
+    refreshed.set()
+    late.join(timeout=5)
+
+    assert results == [True]
+    assert posts == ["old-refresh"]
+    assert client.token["access_token"] == "new-access"
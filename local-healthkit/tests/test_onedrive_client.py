@@ -0,0 +1,151 @@
+"""Tests for OneDriveClient request batching."""
+
+import json
+import threading
+import time
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("msal")
+
+from local_healthkit.clients import onedrive
+from local_healthkit.clients.onedrive import OneDriveClient
+
+
+def _json_response(payload, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("ONEDRIVE_CLIENT_ID", "test-client")
+    return OneDriveClient()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr(onedrive.time, "sleep", waits.append)
+    return waits
+
+
+def _serve(client, *batches):
+    """Answer successive $batch calls with the given response items."""
+    sent = []
+    answers = iter(batches)
+
+    def make_request(endpoint, method="GET", **kwargs):
+        assert endpoint == "$batch" and method == "POST"
+        sent.append(kwargs["json"]["requests"])
+        return _json_response({"responses": next(answers)})
+
+    client.make_request = make_request
+    return sent
+
+
+def test_batch_returns_responses_in_request_order(client):
+    _serve(client, [
+        {"id": "1", "status": 200, "body": {"value": ["b"]}},
+        {"id": "0", "status": 200, "body": {"value": ["a"]}},
+    ])
+
+    responses = client.batch([
+        {"method": "GET", "url": "/me/drive/root:/a:/children"},
+        {"method": "GET", "url": "/me/drive/root:/b:/children"},
+    ])
+
+    assert [r["body"]["value"] for r in responses] == [["a"], ["b"]]
+
+
+def test_batch_keeps_explicit_ids(client):
+    sent = _serve(client, [{"id": "x", "status": 200, "body": {}}])
+
+    responses = client.batch([{"id": "x", "method": "GET", "url": "/me"}])
+
+    assert sent[0][0]["id"] == "x"
+    assert responses[0]["id"] == "x"
+
+
+def test_batch_splits_at_graph_limit(client):
+    requests_list = [{"method": "GET", "url": f"/me/drive/items/{i}"} for i in range(25)]
+    sent = _serve(
+        client,
+        [{"id": str(i), "status": 200} for i in range(20)],
+        [{"id": str(i), "status": 200} for i in range(20, 25)],
+    )
+
+    responses = client.batch(requests_list)
+
+    assert [len(chunk) for chunk in sent] == [20, 5]
+    assert [r["id"] for r in responses] == [str(i) for i in range(25)]
+
+
+def test_batch_missing_response_raises_clear_error(client):
+    _serve(client, [{"id": "0", "status": 200}])
+
+    with pytest.raises(Exception, match="missing for request id\\(s\\): 1"):
+        client.batch([
+            {"method": "GET", "url": "/me/drive/items/a"},
+            {"method": "GET", "url": "/me/drive/items/b"},
+        ])
+
+
+def test_batch_retries_throttled_items_after_retry_after(client, sleeps):
+    sent = _serve(
+        client,
+        [
+            {"id": "0", "status": 200, "body": {"value": ["a"]}},
+            {"id": "1", "status": 429, "headers": {"Retry-After": "3"}},
+        ],
+        [{"id": "1", "status": 200, "body": {"value": ["b"]}}],
+    )
+
+    responses = client.batch([
+        {"method": "GET", "url": "/me/drive/items/a"},
+        {"method": "GET", "url": "/me/drive/items/b", "dependsOn": ["0"]},
+    ])
+
+    assert sleeps == [3.0]
+    assert sent[1] == [{"id": "1", "method": "GET", "url": "/me/drive/items/b"}]
+    assert [r["status"] for r in responses] == [200, 200]
+
+
+def test_batch_returns_throttled_item_after_max_retries(client, sleeps):
+    throttled = {"id": "0", "status": 429, "headers": {"retry-after": "1"}}
+    _serve(client, *([[throttled]] * (client.max_retries + 1)))
+
+    responses = client.batch([{"method": "GET", "url": "/me"}])
+
+    assert len(sleeps) == client.max_retries
+    assert responses[0]["status"] == 429
+
+
+def test_concurrent_token_checks_refresh_once(client):
+    now = time.time()
+    client.token = {"sliding_window_expires_at": now + 30 * 86400, "expires_at": now + 1800}
+    client.access_token = "access"
+    refreshes = []
+
+    def refresh_token(force):
+        refreshes.append(force)
+        time.sleep(0.05)
+        return True
+
+    client._refresh_token = refresh_token
+    tokens = []
+    threads = [
+        threading.Thread(target=lambda: tokens.append(client._get_access_token()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ["access"] * 8
+    assert len(refreshes) == 1
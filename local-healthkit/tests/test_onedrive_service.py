@@ -0,0 +1,57 @@
+"""Tests for OneDriveService concurrency limits."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("msal")
+
+from local_healthkit.services.onedrive import OneDriveService
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("ONEDRIVE_CLIENT_ID", "test-client")
+    return monkeypatch
+
+
+@pytest.mark.parametrize("value", ["eight", "0", "-3", ""])
+def test_invalid_max_concurrency_falls_back_to_default(env, value):
+    env.setenv("ONEDRIVE_MAX_CONCURRENCY", value)
+
+    assert OneDriveService().max_concurrency == OneDriveService.DEFAULT_MAX_CONCURRENCY
+
+
+def test_max_concurrency_from_env(env):
+    env.setenv("ONEDRIVE_MAX_CONCURRENCY", "3")
+
+    assert OneDriveService().max_concurrency == 3
+
+
+def test_upload_files_async_respects_max_concurrency(env):
+    env.setenv("ONEDRIVE_MAX_CONCURRENCY", "2")
+    service = OneDriveService()
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def upload_file(file_path, remote_path):
+        with lock:
+            active.append(file_path)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(file_path)
+        return f"https://share/{file_path}"
+
+    service.upload_file = upload_file
+    paths = [f"report-{i}.pdf" for i in range(7)]
+
+    urls = asyncio.run(service.upload_files_async(paths, "Reports"))
+
+    assert urls == [f"https://share/{path}" for path in paths]
+    assert max(peak) == 2
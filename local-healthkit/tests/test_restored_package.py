@@ -1,166 +1,162 @@
 #!/usr/bin/env python3
 """Test script to verify the restored local-healthkit package works correctly."""
 
+import importlib.util
 import sys
 import traceback
-from datetime import datetime, timedelta
 
-def test_imports():
+# Public names checked by test_imports, grouped for reporting
+EXPORTS = [
+    ("clients", ["OuraClient", "HevyClient", "WhoopClient", "WithingsClient", "OneDriveClient"]),
+    ("services", ["OuraService", "HevyService", "WhoopService", "WithingsService", "OneDriveService"]),
+    ("exceptions", ["LocalHealthKitError", "APIClientError", "AuthenticationError", "RateLimitError"]),
+]
+
+# Third-party modules the clients import (pip name differs for dotenv)
+DEPENDENCIES = ["requests", "authlib", "msal", "dotenv", "pandas"]
+
+class Log:
+    """Collects output lines so each test is written to stdout in one call.
+
+    With ``autoflush`` every line is written immediately, for tests run
+    outside ``main()`` (e.g. collected by pytest).
+    """
+
+    def __init__(self, autoflush=False):
+        self.lines = []
+        self.autoflush = autoflush
+
+    def __call__(self, line=""):
+        self.lines.append(line)
+        if self.autoflush:
+            self.flush()
+
+    def exception(self):
+        """Record the current traceback in order with the other lines."""
+        self(traceback.format_exc().rstrip("\n"))
+
+    def flush(self):
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            sys.stdout.flush()
+            self.lines.clear()
+
+def test_imports(log=None):
     """Test that all clients and services can be imported."""
-    print("🔍 Testing package imports...")
-    
-    try:
-        # Test main package import
-        import local_healthkit
-        print(f"✅ Main package imported - version {local_healthkit.__version__}")
-        
-        # Test client imports
-        from local_healthkit import (
-            OuraClient, HevyClient, WhoopClient, 
-            WithingsClient, OneDriveClient
-        )
-        print("✅ All clients imported successfully")
-        
-        # Test service imports
-        from local_healthkit import (
-            OuraService, HevyService, WhoopService,
-            WithingsService, OneDriveService
-        )
-        print("✅ All services imported successfully")
-        
-        # Test exception imports
-        from local_healthkit import (
-            LocalHealthKitError, APIClientError,
-            AuthenticationError, RateLimitError
-        )
-        print("✅ All exceptions imported successfully")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Import failed: {e}")
-        traceback.print_exc()
-        return False
-
-def test_client_initialization():
+    log = log or Log(autoflush=True)
+    log("🔍 Testing package imports...")
+    
+    # Test main package import
+    import local_healthkit
+    assert local_healthkit.__version__, "Package has no version"
+    log(f"✅ Main package imported - version {local_healthkit.__version__}")
+    
+    # Probe dependencies without executing them, so a failed import
+    # below can be traced to a missing package
+    missing = [name for name in DEPENDENCIES if importlib.util.find_spec(name) is None]
+    if missing:
+        log(f"⚠️  Missing dependencies: {', '.join(missing)}")
+    else:
+        log("✅ All dependencies installed")
+    
+    # Resolve every lazily imported client, service and exception
+    for group, names in EXPORTS:
+        for name in names:
+            exported = getattr(local_healthkit, name)
+            assert isinstance(exported, type), f"{name} is not a class"
+            assert name in dir(local_healthkit), f"{name} missing from dir()"
+        log(f"✅ All {group} imported successfully")
+
+# (class name, what a missing environment variable means) per client
+CLIENTS = [
+    ("OuraClient", "API key"),
+    ("HevyClient", "API key"),
+    ("WhoopClient", "credentials"),
+    ("WithingsClient", "credentials"),
+    ("OneDriveClient", "credentials"),
+]
+
+# Service configs checked by test_configuration
+SERVICE_CONFIGS = [
+    ("Whoop", "WHOOP"),
+    ("Withings", "WITHINGS"),
+    ("Oura", "OURA"),
+    ("Hevy", "HEVY"),
+    ("OneDrive", "ONEDRIVE"),
+]
+
+def test_client_initialization(log=None):
     """Test that clients can be initialized."""
-    print("\n🔍 Testing client initialization...")
+    log = log or Log(autoflush=True)
+    log("\n🔍 Testing client initialization...")
     
-    try:
-        # Test API key clients
-        from local_healthkit import OuraClient, HevyClient
-        
-        try:
-            oura = OuraClient()
-            print(f"✅ OuraClient initialized - authenticated: {oura.is_authenticated()}")
-        except ValueError as e:
-            print(f"✅ OuraClient correctly requires API key: {str(e)[:50]}...")
-        
-        try:
-            hevy = HevyClient()
-            print(f"✅ HevyClient initialized - authenticated: {hevy.is_authenticated()}")
-        except ValueError as e:
-            print(f"✅ HevyClient correctly requires API key: {str(e)[:50]}...")
-        
-        # Test OAuth2 clients
-        from local_healthkit import WhoopClient, WithingsClient, OneDriveClient
-        
-        try:
-            whoop = WhoopClient()
-            print(f"✅ WhoopClient initialized - authenticated: {whoop.is_authenticated()}")
-        except ValueError as e:
-            print(f"✅ WhoopClient correctly requires credentials: {str(e)[:50]}...")
-        
+    import local_healthkit
+    
+    for name, requirement in CLIENTS:
+        client_class = getattr(local_healthkit, name)
         try:
-            withings = WithingsClient()
-            print(f"✅ WithingsClient initialized - authenticated: {withings.is_authenticated()}")
+            client = client_class()
         except ValueError as e:
-            print(f"✅ WithingsClient correctly requires credentials: {str(e)[:50]}...")
-        
+            # Missing environment variables must be reported by name
+            assert str(e), f"{name} raised an empty ValueError"
+            log(f"✅ {name} correctly requires {requirement}: {str(e)[:50]}...")
+            continue
+        assert isinstance(client, client_class)
+        log(f"✅ {name} initialized - authenticated: {client.is_authenticated()}")
+
+def test_service_initialization(log=None):
+    """Test that services can be initialized (they wrap clients)."""
+    log = log or Log(autoflush=True)
+    log("\n🔍 Testing service initialization...")
+    
+    from local_healthkit import (
+        OuraService, HevyService, WhoopService,
+        WithingsService, OneDriveService
+    )
+    
+    # Test service initialization
+    services = [
+        ("OuraService", OuraService),
+        ("HevyService", HevyService), 
+        ("WhoopService", WhoopService),
+        ("WithingsService", WithingsService),
+        ("OneDriveService", OneDriveService)
+    ]
+    
+    for name, service_class in services:
         try:
-            onedrive = OneDriveClient()
-            print(f"✅ OneDriveClient initialized - authenticated: {onedrive.is_authenticated()}")
+            service = service_class()
         except ValueError as e:
-            print(f"✅ OneDriveClient correctly requires credentials: {str(e)[:50]}...")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Client initialization test failed: {e}")
-        traceback.print_exc()
-        return False
-
-def test_service_initialization():
-    """Test that services can be initialized (they wrap clients)."""
-    print("\n🔍 Testing service initialization...")
-    
-    try:
-        from local_healthkit import (
-            OuraService, HevyService, WhoopService,
-            WithingsService, OneDriveService
-        )
-        
-        # Test service initialization
-        services = [
-            ("OuraService", OuraService),
-            ("HevyService", HevyService), 
-            ("WhoopService", WhoopService),
-            ("WithingsService", WithingsService),
-            ("OneDriveService", OneDriveService)
-        ]
-        
-        for name, service_class in services:
-            try:
-                service = service_class()
-                print(f"✅ {name} initialized - authenticated: {service.is_authenticated()}")
-            except ValueError as e:
-                print(f"✅ {name} correctly requires credentials: {str(e)[:50]}...")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Service initialization test failed: {e}")
-        traceback.print_exc()
-        return False
-
-def test_configuration():
+            assert str(e), f"{name} raised an empty ValueError"
+            log(f"✅ {name} correctly requires credentials: {str(e)[:50]}...")
+            continue
+        assert service.client is not None, f"{name} has no client"
+        log(f"✅ {name} initialized - authenticated: {service.is_authenticated()}")
+
+def test_configuration(log=None):
     """Test that configuration classes work."""
-    print("\n🔍 Testing configuration...")
-    
-    try:
-        from local_healthkit.clients.base.config import ClientFactory
-        
-        # Test client config
-        config = ClientFactory.get_client_config()
-        print(f"✅ Client config loaded - max_retries: {config.max_retries}")
-        
-        # Test service configs (they return dictionaries)
-        whoop_config = ClientFactory.get_service_config("WHOOP")
-        print(f"✅ Whoop config loaded - base_url: {whoop_config['base_url']}")
-        
-        withings_config = ClientFactory.get_service_config("WITHINGS")
-        print(f"✅ Withings config loaded - base_url: {withings_config['base_url']}")
-        
-        oura_config = ClientFactory.get_service_config("OURA")
-        print(f"✅ Oura config loaded - base_url: {oura_config['base_url']}")
-        
-        hevy_config = ClientFactory.get_service_config("HEVY")
-        print(f"✅ Hevy config loaded - base_url: {hevy_config['base_url']}")
-        
-        onedrive_config = ClientFactory.get_service_config("ONEDRIVE")
-        print(f"✅ OneDrive config loaded - base_url: {onedrive_config['base_url']}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        traceback.print_exc()
-        return False
+    log = log or Log(autoflush=True)
+    log("\n🔍 Testing configuration...")
+    
+    from local_healthkit.clients.base.config import ClientFactory
+    
+    # Test client config
+    config = ClientFactory.get_client_config()
+    assert config.max_retries >= 0, "max_retries must not be negative"
+    assert config.retry_delays, "retry_delays must not be empty"
+    log(f"✅ Client config loaded - max_retries: {config.max_retries}")
+    
+    # Test service configs (they return dictionaries)
+    for label, service in SERVICE_CONFIGS:
+        service_config = ClientFactory.get_service_config(service)
+        assert service_config["base_url"].startswith("https://"), f"{label} base_url is not HTTPS"
+        log(f"✅ {label} config loaded - base_url: {service_config['base_url']}")
 
 def main():
     """Run all tests."""
-    print("🚀 Testing restored Local HealthKit package...")
-    print("=" * 60)
+    log = Log()
+    log("🚀 Testing restored Local HealthKit package...")
+    log("=" * 60)
     
     tests = [
         test_imports,
@@ -173,19 +169,25 @@ def main():
     total = len(tests)
     
     for test in tests:
-        if test():
+        try:
+            test(log)
             passed += 1
-        else:
-            print(f"\n❌ Test {test.__name__} failed!")
+        except Exception as e:
+            log(f"❌ {e}")
+            log.exception()
+            log(f"\n❌ Test {test.__name__} failed!")
+        log.flush()
     
-    print("\n" + "=" * 60)
-    print(f"📊 Test Results: {passed}/{total} tests passed")
+    log("\n" + "=" * 60)
+    log(f"📊 Test Results: {passed}/{total} tests passed")
     
     if passed == total:
-        print("🎉 All tests passed! The restored package is working correctly.")
+        log("🎉 All tests passed! The restored package is working correctly.")
+        log.flush()
         return 0
     else:
-        print("⚠️  Some tests failed. Check the output above for details.")
+        log("⚠️  Some tests failed. Check the output above for details.")
+        log.flush()
         return 1
 
 if __name__ == "__main__":
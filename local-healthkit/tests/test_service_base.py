@@ -0,0 +1,148 @@
+"""Tests for the shared BaseAPIService helpers."""
+
+import logging
+import threading
+from datetime import date
+
+import pytest
+
+from local_healthkit.services.base import BaseAPIService, LazyFetchResult
+
+
+class FakeClient:
+    """Client whose authentication state the test flips directly."""
+
+    def __init__(self):
+        self.authenticated = True
+
+    def is_authenticated(self):
+        return self.authenticated
+
+
+class DemoService(BaseAPIService):
+    """Minimal concrete service."""
+
+    def __init__(self, client=None):
+        super().__init__(client or FakeClient())
+
+
+def test_is_authenticated_follows_client_immediately():
+    client = FakeClient()
+    service = DemoService(client)
+
+    assert service.is_authenticated()
+    client.authenticated = False
+    assert not service.is_authenticated()
+
+
+@pytest.mark.parametrize("response_size", [3, 2.5, "12 KB"])
+def test_log_api_call_accepts_any_response_size(caplog, response_size):
+    service = DemoService()
+
+    with caplog.at_level(logging.INFO, logger="DemoService"):
+        service.log_api_call("workouts", {"page": 1}, response_size)
+
+    assert caplog.records[-1].getMessage() == (
+        f"API call to workouts with params: {{'page': 1}} returned {response_size} items"
+    )
+
+
+class CountingFetchers(dict):
+    """Fetchers keyed by data type that record how often each one ran."""
+
+    def __init__(self, keys, before_fetch=None):
+        super().__init__()
+        self.calls = {key: 0 for key in keys}
+        self.lock = threading.Lock()
+        for key in keys:
+            self[key] = self._fetcher(key, before_fetch)
+
+    def _fetcher(self, key, before_fetch):
+        def fetch():
+            with self.lock:
+                self.calls[key] += 1
+            if before_fetch:
+                before_fetch(key)
+            return {"records": [key]}
+        return fetch
+
+
+def test_lazy_result_fetches_only_the_accessed_key():
+    fetchers = CountingFetchers(["sleep", "recovery", "workouts"])
+    result = LazyFetchResult(fetchers)
+
+    assert result["sleep"] == {"records": ["sleep"]}
+    assert result["sleep"] == {"records": ["sleep"]}
+
+    assert fetchers.calls == {"sleep": 1, "recovery": 0, "workouts": 0}
+    assert result.is_fetched("sleep") and not result.is_fetched("recovery")
+    assert list(result) == ["sleep", "recovery", "workouts"]
+    with pytest.raises(KeyError):
+        result["steps"]
+
+
+def test_lazy_result_items_fetches_remaining_keys_concurrently():
+    # Every remaining fetcher waits for the others, so a sequential fetch
+    # would break the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    fetchers = CountingFetchers(
+        ["sleep", "recovery", "workouts", "cycles"],
+        before_fetch=lambda key: key != "sleep" and barrier.wait(),
+    )
+    result = LazyFetchResult(fetchers, max_workers=4)
+    result["sleep"]
+
+    items = dict(result.items())
+
+    assert items == {key: {"records": [key]} for key in fetchers}
+    assert fetchers.calls == {key: 1 for key in fetchers}
+    assert list(result.values()) == list(items.values())
+    assert fetchers.calls == {key: 1 for key in fetchers}
+
+
+def test_lazy_result_racing_readers_fetch_a_key_once():
+    started = threading.Event()
+    release = threading.Event()
+
+    def before_fetch(key):
+        started.set()
+        release.wait(timeout=5)
+
+    fetchers = CountingFetchers(["sleep"], before_fetch=before_fetch)
+    result = LazyFetchResult(fetchers)
+    values = []
+    readers = [threading.Thread(target=lambda: values.append(result["sleep"])) for _ in range(2)]
+    for reader in readers:
+        reader.start()
+    assert started.wait(timeout=5)
+    release.set()
+    for reader in readers:
+        reader.join(timeout=5)
+
+    assert fetchers.calls == {"sleep": 1}
+    assert values == [{"records": ["sleep"]}] * 2
+
+
+def test_whoop_fetch_data_lazy_requests_and_logs_per_key(tmp_path, monkeypatch, caplog):
+    pytest.importorskip("authlib")
+    from local_healthkit.services.whoop import WhoopService
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("WHOOP_CLIENT_ID", "id")
+    monkeypatch.setenv("WHOOP_CLIENT_SECRET", "secret")
+    service = WhoopService()
+    requests = []
+    for _, method, _ in WhoopService.ENDPOINTS:
+        monkeypatch.setattr(service, method,
+                            lambda start, end, method=method: requests.append(method) or {"records": [1, 2]})
+
+    with caplog.at_level(logging.INFO, logger="WhoopService"):
+        data = service.fetch_data_lazy(date(2024, 3, 1), date(2024, 3, 2))
+        assert requests == []
+        assert data["sleep"] == {"records": [1, 2]}
+
+    assert requests == ["get_sleep_data"]
+    assert [r.getMessage() for r in caplog.records] == [
+        "API call to sleep with params: {'start': datetime.date(2024, 3, 1), "
+        "'end': datetime.date(2024, 3, 2)} returned 2 items"
+    ]
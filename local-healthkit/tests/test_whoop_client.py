@@ -0,0 +1,45 @@
+"""Tests for the Whoop client's paginated range requests."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("authlib")
+
+from local_healthkit.clients.whoop import WhoopClient
+
+
+def _json_response(payload):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("WHOOP_CLIENT_ID", "id")
+    monkeypatch.setenv("WHOOP_CLIENT_SECRET", "secret")
+    client = WhoopClient()
+    client.requests = []
+
+    def make_request(endpoint, params=None, **kwargs):
+        client.requests.append(dict(params))
+        return _json_response({"records": [{"id": len(client.requests)}]})
+
+    client.make_request = make_request
+    return client
+
+
+@pytest.mark.parametrize("tzinfo", [None, timezone.utc])
+def test_range_bounds_use_whoop_timestamp_format(client, tzinfo):
+    start = datetime(2024, 3, 1, 0, 0, 0, 123456, tzinfo=tzinfo)
+    end = datetime(2024, 3, 2, 23, 59, 59, tzinfo=tzinfo)
+
+    client.get_recovery_data(start, end)
+
+    assert client.requests[0]["start"] == "2024-03-01T00:00:00Z"
+    assert client.requests[0]["end"] == "2024-03-03T23:59:59Z"
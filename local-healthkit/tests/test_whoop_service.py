@@ -0,0 +1,69 @@
+"""Tests for WhoopService range backfills."""
+
+from datetime import date
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("authlib")
+
+from local_healthkit.services.whoop import WhoopService
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("WHOOP_CLIENT_ID", "id")
+    monkeypatch.setenv("WHOOP_CLIENT_SECRET", "secret")
+    service = WhoopService()
+    service.windows = []
+
+    def fetch_data(start_date, end_date):
+        service.windows.append((start_date, end_date))
+        return {
+            endpoint: {"records": [f"{endpoint}:{start_date.isoformat()}"], "next_token": None}
+            for endpoint, _, _ in WhoopService.ENDPOINTS
+        }
+
+    service.fetch_data = fetch_data
+    return service
+
+
+def test_range_is_split_at_chunk_boundaries(service):
+    service.fetch_data_range(date(2024, 1, 1), date(2024, 1, 10), chunk_days=4)
+
+    assert service.windows == [
+        (date(2024, 1, 1), date(2024, 1, 4)),
+        (date(2024, 1, 5), date(2024, 1, 8)),
+        (date(2024, 1, 9), date(2024, 1, 10)),
+    ]
+
+
+def test_range_shorter_than_one_window(service):
+    service.fetch_data_range(date(2024, 1, 1), date(2024, 1, 3), chunk_days=30)
+
+    assert service.windows == [(date(2024, 1, 1), date(2024, 1, 3))]
+
+
+def test_single_day_range(service):
+    service.fetch_data_range(date(2024, 1, 1), date(2024, 1, 1), chunk_days=1)
+
+    assert service.windows == [(date(2024, 1, 1), date(2024, 1, 1))]
+
+
+@pytest.mark.parametrize("chunk_days", [0, -1])
+def test_chunk_days_below_one_is_rejected(service, chunk_days):
+    with pytest.raises(ValueError):
+        service.fetch_data_range(date(2024, 1, 1), date(2024, 1, 2), chunk_days=chunk_days)
+    assert service.windows == []
+
+
+def test_records_are_concatenated_per_endpoint(service):
+    data = service.fetch_data_range(date(2024, 1, 1), date(2024, 1, 6), chunk_days=3)
+
+    assert list(data) == [endpoint for endpoint, _, _ in WhoopService.ENDPOINTS]
+    for endpoint, result in data.items():
+        assert result == {
+            "records": [f"{endpoint}:2024-01-01", f"{endpoint}:2024-01-04"],
+            "next_token": None,
+        }
@@ -67,8 +67,11 @@ class AppConfig:
 
     # ===== Reporting Configuration =====
 
+    # Reports directory - markdown/PDF reports are written here
+    REPORTING_DIR = os.path.join("data", "05_reports")
+
     # Charts directory - within reports directory for easier PDF generation
-    REPORTING_CHARTS_DIR = os.path.join("data", "05_reports", "charts")
+    REPORTING_CHARTS_DIR = os.path.join(REPORTING_DIR, "charts")
 
     # Chart colors
     REPORTING_COLORS = {
@@ -5,13 +5,19 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to Python path
-project_root = str(Path(__file__).parent.parent)
-sys.path.insert(0, project_root)
+# Add project root to Python path when run as a script (python src/main.py);
+# importing src.main as a module leaves sys.path untouched
+if not __package__:
+    project_root = str(Path(__file__).parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
 
-from src.pipeline.orchestrator import HealthDataOrchestrator
-from src.reporting.pdf_converter import PDFConverter
-from src.utils.progress_indicators import ProgressIndicator, Colors
+from src.app_config import AppConfig  # noqa: E402
+from src.utils.file_utils import find_latest_file  # noqa: E402
+from src.utils.progress_indicators import ProgressIndicator, Colors  # noqa: E402
+
+# Built once at import instead of in every command
+REPORTS_DIR = Path(AppConfig.REPORTING_DIR)
 
 def fetch_data(days: int = 8) -> None:
     """Fetch health data and generate report.
@@ -22,8 +28,10 @@ def fetch_data(days: int = 8) -> None:
     ProgressIndicator.section_header("Health Data Pipeline")
     
     try:
-        # Initialize orchestrator
+        # Initialize orchestrator (imported here so --pdf and --help skip the pipeline)
         ProgressIndicator.step_start("Initializing pipeline...")
+        from src.pipeline.orchestrator import HealthDataOrchestrator
+
         orchestrator = HealthDataOrchestrator()
         ProgressIndicator.step_complete("Pipeline initialized")
         
@@ -42,11 +50,9 @@ def fetch_data(days: int = 8) -> None:
         ProgressIndicator.step_complete(f"Services processed: {len(result.services_processed)}")
         
         # Find generated report
-        reports_dir = Path("data/05_reports")
-        if reports_dir.exists():
-            md_files = list(reports_dir.glob("health_report_*.md"))
-            if md_files:
-                latest_report = max(md_files, key=lambda f: f.stat().st_mtime)
+        if REPORTS_DIR.exists():
+            latest_report = find_latest_file(REPORTS_DIR, "health_report_", ".md")
+            if latest_report:
                 ProgressIndicator.step_complete(f"Report generated: {latest_report.name}")
             else:
                 ProgressIndicator.step_warning("No report files found")
@@ -63,26 +69,25 @@ def convert_to_pdf() -> None:
     try:
         # Find latest report
         ProgressIndicator.step_start("Looking for latest report...")
-        reports_dir = Path("data/05_reports")
-        
-        if not reports_dir.exists():
+        if not REPORTS_DIR.exists():
             ProgressIndicator.step_error("Reports directory not found. Run 'fetch' first.")
             sys.exit(1)
         
-        md_files = list(reports_dir.glob("health_report_*.md"))
-        if not md_files:
+        latest_report = find_latest_file(REPORTS_DIR, "health_report_", ".md")
+        if not latest_report:
             ProgressIndicator.step_error("No markdown reports found. Run 'fetch' first.")
             sys.exit(1)
         
-        latest_report = max(md_files, key=lambda f: f.stat().st_mtime)
         ProgressIndicator.step_complete(f"Found report: {latest_report.name}")
         
         # Convert to PDF
         ProgressIndicator.step_start("Converting to PDF...")
+        from src.reporting.pdf_converter import PDFConverter  # weasyprint is slow to import
+
         pdf_converter = PDFConverter()
         pdf_path = pdf_converter.markdown_to_pdf(
-            str(latest_report), 
-            str(latest_report).replace('.md', '.pdf')
+            latest_report.path, 
+            latest_report.path.replace('.md', '.pdf')
         )
         
         # Get file size
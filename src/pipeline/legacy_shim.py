@@ -4,14 +4,25 @@ This adapter allows the legacy reporting system to consume in-memory data from
 the new pipeline without any CSV file I/O.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
 
 import pandas as pd
 
 from src.utils.logging_utils import HealthLogger
 
 
+@lru_cache(maxsize=4096)
+def _legacy_date_labels(day: date) -> Tuple[str, str]:
+    """Return the legacy (3-letter day, MM-DD) labels for a date.
+    
+    The macros, recovery and training tables cover the same week, so the
+    labels for each date are formatted once and reused across all three.
+    """
+    return day.strftime('%a'), day.strftime('%m-%d')
+
+
 class MemoryBasedLegacyShim:
     """Memory-based shim that works with in-memory aggregated data.
     
@@ -96,6 +107,17 @@ class MemoryBasedLegacyShim:
         self.logger.info(f"Filtered data: {len(filtered_df)} records from {start_date.date()} to {end_date.date()}")
         return filtered_df
     
+    def _format_date_columns(self, df: pd.DataFrame) -> None:
+        """Replace 'date' with MM-DD strings and set 'day' to 3-letter day names.
+        
+        Args:
+            df: Non-empty DataFrame with a 'date' column (modified in place)
+        """
+        # Both labels come from the full date, so compute them before replacing it
+        labels = [_legacy_date_labels(day) for day in pd.to_datetime(df['date']).dt.date]
+        df['day'] = [day_name for day_name, _ in labels]
+        df['date'] = [month_day for _, month_day in labels]
+    
     def weekly_macros_and_activity(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """Get weekly macros and activity metrics (legacy interface).
         
@@ -109,11 +131,8 @@ class MemoryBasedLegacyShim:
         df = self._filter_last_7_days(df, end_date)
         
         if not df.empty:
-            # Calculate day BEFORE converting date format (need full date for correct day calculation)
-            df['day'] = pd.to_datetime(df['date']).dt.strftime('%a')  # 3-letter day
-            
-            # Convert to exact legacy format
-            df['date'] = pd.to_datetime(df['date']).dt.strftime('%m-%d')  # MM-DD format
+            # Convert to exact legacy format: 3-letter day and MM-DD date
+            self._format_date_columns(df)
             
             # Convert sport_type to activity column (legacy format expects string)
             if 'sport_type' in df.columns:
@@ -146,9 +165,8 @@ class MemoryBasedLegacyShim:
         df = self._filter_last_7_days(df, end_date)
         
         if not df.empty:
-            # Convert to exact legacy format - calculate day BEFORE converting date format
-            df['day'] = pd.to_datetime(df['date']).dt.strftime('%a')  # 3-letter day (with year)
-            df['date'] = pd.to_datetime(df['date']).dt.strftime('%m-%d')  # MM-DD format
+            # Convert to exact legacy format: 3-letter day and MM-DD date
+            self._format_date_columns(df)
             # Convert sleep times from minutes to hours (legacy format expects hours)
             if 'sleep_need' in df.columns:
                 df['sleep_need'] = df['sleep_need'] / 60  # minutes to hours
@@ -176,9 +194,8 @@ class MemoryBasedLegacyShim:
             if 'title' in df.columns:
                 df['sport'] = df['title']
             
-            # Convert to exact legacy format - calculate day BEFORE converting date format
-            df['day'] = pd.to_datetime(df['date']).dt.strftime('%a')  # 3-letter day (with year)
-            df['date'] = pd.to_datetime(df['date']).dt.strftime('%m-%d')  # MM-DD format
+            # Convert to exact legacy format: 3-letter day and MM-DD date
+            self._format_date_columns(df)
             
             # Format duration
             if 'duration' in df.columns:
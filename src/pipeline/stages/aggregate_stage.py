@@ -72,44 +72,48 @@ class AggregateStage(PipelineStage):
             'training_metrics': []
         }
         
+        # Resolve each aggregator and collect its input data once; neither
+        # depends on the day, so the daily loop below only aggregates
+        aggregators = []
+        for aggregator_name in self.registry.get_all_aggregator_names():
+            aggregator_info = self.registry.get_aggregator(aggregator_name)
+            if not aggregator_info:
+                continue
+            
+            # Collect data required by this aggregator
+            aggregator_data = self.registry.collect_data_for_aggregator(
+                aggregator_name, context.transformed_data
+            )
+            aggregators.append((aggregator_name, aggregator_info['instance'], aggregator_data))
+        
+        # The macros aggregator covers the whole range in one call, so its
+        # records are grouped by date once rather than scanned every day
+        for aggregator_name, aggregator, aggregator_data in aggregators:
+            if aggregator_name == 'macros':
+                self.logger.info(f"🔍 Processing macros for {context.start_date} to {context.end_date}: {len(aggregator_data.get('workouts', []))} workouts")
+                self.logger.info(f"  Nutrition records: {len(aggregator_data.get('nutrition', []))}")
+                self.logger.info(f"  Activity records: {len(aggregator_data.get('activity', []))}")
+                self.logger.info(f"  Weight records: {len(aggregator_data.get('weight', []))}")
+                self.logger.info(f"  Available data keys: {list(aggregator_data.keys())}")
+                results = aggregator.aggregate_date_range(
+                    context.start_date,
+                    context.end_date,
+                    aggregator_data.get('nutrition', []),
+                    aggregator_data.get('activity', []),
+                    aggregator_data.get('weight', []),
+                    aggregator_data.get('workouts', [])
+                )
+                for result in results:
+                    self.logger.info(f"🎯 Macros result for {result.date}: {result.sport_type}")
+                aggregated_data['macros_activity'].extend(results)
+        
         # Process each day in the date range
         current_date = context.start_date
         while current_date <= context.end_date:
-            # Process all registered aggregators
-            for aggregator_name in self.registry.get_all_aggregator_names():
-                # Collect data required by this aggregator
-                aggregator_data = self.registry.collect_data_for_aggregator(
-                    aggregator_name, context.transformed_data
-                )
-                
-                # Get aggregator instance
-                aggregator_info = self.registry.get_aggregator(aggregator_name)
-                if not aggregator_info:
-                    continue
-                
-                aggregator = aggregator_info['instance']
-                
+            # Process the remaining per-day aggregators
+            for aggregator_name, aggregator, aggregator_data in aggregators:
                 # Call appropriate aggregation method based on aggregator type
-                if aggregator_name == 'macros':
-                    self.logger.info(f"🔍 Processing macros for {current_date}: {len(aggregator_data.get('workouts', []))} workouts")
-                    self.logger.info(f"  Nutrition records: {len(aggregator_data.get('nutrition', []))}")
-                    self.logger.info(f"  Activity records: {len(aggregator_data.get('activity', []))}")
-                    self.logger.info(f"  Weight records: {len(aggregator_data.get('weight', []))}")
-                    self.logger.info(f"  Available data keys: {list(aggregator_data.keys())}")
-                    result = aggregator.aggregate_daily_data(
-                        current_date, 
-                        aggregator_data.get('nutrition', []),
-                        aggregator_data.get('activity', []),
-                        aggregator_data.get('weight', []),
-                        aggregator_data.get('workouts', [])
-                    )
-                    self.logger.info(f"🎯 Macros result for {current_date}: {result.sport_type if result else 'None'}")
-                    if result:
-                        aggregated_data['macros_activity'].append(result)
-                    else:
-                        self.logger.warning(f"⚠️ No macros result for {current_date}")
-                
-                elif aggregator_name == 'recovery':
+                if aggregator_name == 'recovery':
                     result = aggregator.aggregate_daily_recovery(
                         current_date,
                         aggregator_data.get('recovery', []),
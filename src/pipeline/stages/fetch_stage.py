@@ -1,12 +1,21 @@
 """Fetch stage for retrieving raw data from health services."""
 
+import local_healthkit
+
 from .base_stage import PipelineStage, PipelineContext, StageResult
-from local_healthkit import (
-    WhoopService, OuraService, WithingsService, HevyService, NutritionService
-)
 from src.utils.pipeline_persistence import PipelinePersistence
 from datetime import datetime
 
+# Service class per pipeline service name; local_healthkit imports each
+# class (and its client dependencies) only when it is first requested
+SERVICE_CLASSES = {
+    'whoop': 'WhoopService',
+    'oura': 'OuraService',
+    'withings': 'WithingsService',
+    'hevy': 'HevyService',
+    'nutrition': 'NutritionService',
+}
+
 
 class FetchStage(PipelineStage):
     """Stage 1: Fetch raw data from all configured health services."""
@@ -15,14 +24,9 @@ class FetchStage(PipelineStage):
         """Initialize the fetch stage."""
         super().__init__('fetch')
         
-        # Initialize services directly (no processor wrapper layer)
-        self.services = {
-            'whoop': WhoopService(),
-            'oura': OuraService(),
-            'withings': WithingsService(),
-            'hevy': HevyService(),
-            'nutrition': NutritionService()
-        }
+        # Services are created on first use (no processor wrapper layer), so
+        # a run limited to some services never imports or builds the others
+        self.services = {}
         
         # Initialize persistence for raw data writing
         self.persistence = PipelinePersistence()
@@ -44,13 +48,13 @@ class FetchStage(PipelineStage):
         timestamp = datetime.now()
         
         for service in context.services:
-            if service not in self.services:
+            if service not in SERVICE_CLASSES:
                 self.logger.warning(f"Unknown service: {service}")
                 failed_services.append(service)
                 continue
             
             self.logger.info(f"📡 Fetching {service} data...")
-            service_instance = self.services[service]
+            service_instance = self._get_service(service)
             
             # Fetch raw data directly from service (no processor wrapper)
             raw_data = self._fetch_service_data(service, service_instance, context.start_date, context.end_date)
@@ -98,6 +102,21 @@ class FetchStage(PipelineStage):
                 error=f"Failed to fetch data from all services: {', '.join(failed_services)}"
             )
     
+    def _get_service(self, service_name: str):
+        """Return the service instance for a name, creating it on first use.
+        
+        Args:
+            service_name: Name of the service (a key of SERVICE_CLASSES)
+            
+        Returns:
+            The cached service instance
+        """
+        service_instance = self.services.get(service_name)
+        if service_instance is None:
+            service_class = getattr(local_healthkit, SERVICE_CLASSES[service_name])
+            service_instance = self.services[service_name] = service_class()
+        return service_instance
+    
     def _generate_raw_data_files(self, service: str, raw_data: dict, timestamp: datetime) -> dict:
         """Generate raw data JSON files.
         
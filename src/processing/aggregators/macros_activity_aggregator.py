@@ -1,8 +1,8 @@
 """Macros and Activity aggregator for combining nutrition and activity data."""
 
 import logging
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 
 from src.models.raw_data import NutritionRecord, ActivityRecord, WeightRecord, WorkoutRecord
 from src.models.aggregations import MacrosAndActivityRecord
@@ -15,6 +15,40 @@ class MacrosActivityAggregator:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    def aggregate_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        nutrition_records: List[NutritionRecord],
+        activity_records: List[ActivityRecord],
+        weight_records: List[WeightRecord],
+        workout_records: List[WorkoutRecord] = None
+    ) -> List[MacrosAndActivityRecord]:
+        """Aggregate nutrition, activity, and weight data for each day in a range.
+        
+        Each record list is grouped by date once for the whole range, so
+        every day is a dictionary lookup instead of a scan of every list.
+        
+        Args:
+            start_date: First date to aggregate (inclusive)
+            end_date: Last date to aggregate (inclusive)
+            nutrition_records: Nutrition data for the range
+            activity_records: Activity data for the range
+            weight_records: Weight measurements for the range
+            workout_records: Workout data for determining primary sport
+            
+        Returns:
+            One aggregated record per day, in date order
+        """
+        indexes = self._index_records(nutrition_records, activity_records, weight_records, workout_records)
+        
+        results = []
+        current_date = start_date
+        while current_date <= end_date:
+            results.append(self._aggregate_day(current_date, indexes, activity_records, workout_records))
+            current_date += timedelta(days=1)
+        return results
+    
     def aggregate_daily_data(
         self,
         target_date: date,
@@ -25,6 +59,9 @@ class MacrosActivityAggregator:
     ) -> MacrosAndActivityRecord:
         """Aggregate daily nutrition, activity, and weight data.
         
+        Use aggregate_date_range for several days, so the records are only
+        grouped by date once.
+        
         Args:
             target_date: Date to aggregate data for
             nutrition_records: Nutrition data for the date
@@ -35,15 +72,53 @@ class MacrosActivityAggregator:
         Returns:
             Aggregated daily macros and activity record
         """
-        # Debug: Show what activity records we have
+        indexes = self._index_records(nutrition_records, activity_records, weight_records, workout_records)
+        return self._aggregate_day(target_date, indexes, activity_records, workout_records)
+    
+    def _index_records(
+        self,
+        nutrition_records: List[NutritionRecord],
+        activity_records: List[ActivityRecord],
+        weight_records: List[WeightRecord],
+        workout_records: Optional[List[WorkoutRecord]]
+    ) -> Dict[str, Dict[date, list]]:
+        """Group each record list by date for one aggregation call."""
+        return {
+            'nutrition': self._records_by_date(nutrition_records),
+            'activity': self._records_by_date(activity_records),
+            'weight': self._records_by_date(weight_records),
+            'workouts': self._records_by_date(workout_records or []),
+        }
+    
+    def _aggregate_day(
+        self,
+        target_date: date,
+        indexes: Dict[str, Dict[date, list]],
+        activity_records: List[ActivityRecord],
+        workout_records: Optional[List[WorkoutRecord]]
+    ) -> MacrosAndActivityRecord:
+        """Aggregate one day from records already grouped by date.
+        
+        Args:
+            target_date: Date to aggregate data for
+            indexes: Records by date per data type (see _index_records)
+            activity_records: All activity records (for debug logging)
+            workout_records: All workout records (for debug logging)
+            
+        Returns:
+            Aggregated daily macros and activity record
+        """
+        # Debug: Show what activity records we have (formatting every record
+        # for every day is skipped unless INFO logging is enabled)
         self.logger.info(f"🔍 Activity records for {target_date}: {len(activity_records)} total")
-        for i, record in enumerate(activity_records):  # Show all records
-            self.logger.info(f"  Activity {i+1}: date={getattr(record, 'date', 'N/A')}, steps={getattr(record, 'steps', 'N/A')}, source={getattr(record, 'source', 'N/A')}")
+        if self.logger.isEnabledFor(logging.INFO):
+            for i, record in enumerate(activity_records):  # Show all records
+                self.logger.info(f"  Activity {i+1}: date={getattr(record, 'date', 'N/A')}, steps={getattr(record, 'steps', 'N/A')}, source={getattr(record, 'source', 'N/A')}")
         
         # Find records for target date
-        nutrition = self._find_nutrition_for_date(nutrition_records, target_date)
-        activity = self._find_activity_for_date(activity_records, target_date)
-        weight = self._find_weight_for_date(weight_records, target_date)
+        nutrition = self._find_nutrition_for_date(indexes['nutrition'], target_date)
+        activity = self._find_activity_for_date(indexes['activity'], target_date)
+        weight = self._find_weight_for_date(indexes['weight'], target_date)
         
         # Debug: Show what we found
         self.logger.info(f"🎯 Found for {target_date}: nutrition={'✅' if nutrition else '❌'}, activity={'✅' if activity else '❌'} (steps={getattr(activity, 'steps', 'N/A') if activity else 'N/A'}, source={getattr(activity, 'source', 'N/A') if activity else 'N/A'}), weight={'✅' if weight else '❌'}")
@@ -55,7 +130,7 @@ class MacrosActivityAggregator:
                 self.logger.info(f"  Workout {i+1}: date={getattr(w, 'date', 'N/A')}, source={getattr(w, 'source', 'N/A')}, sport_type={getattr(w, 'sport_type', 'N/A')}")
         
         # Determine primary sport for the day from workout records
-        primary_sport = self._get_primary_sport(workout_records, target_date)
+        primary_sport = self._get_primary_sport(workout_records, indexes['workouts'], target_date)
         self.logger.info(f"🎯 Primary sport determined for {target_date}: {primary_sport}")
         
         result = MacrosAndActivityRecord(
@@ -77,16 +152,29 @@ class MacrosActivityAggregator:
         self.logger.info(f"✅ Successfully created record for {target_date} with sport_type={primary_sport}")
         return result
     
-    def _find_nutrition_for_date(self, records: List[NutritionRecord], target_date: date) -> Optional[NutritionRecord]:
-        """Find nutrition record for specific date."""
+    @staticmethod
+    def _records_by_date(records: list) -> Dict[date, list]:
+        """Group records by date, keeping their original order within each date.
+        
+        Args:
+            records: Records with a ``date`` attribute
+            
+        Returns:
+            Dictionary mapping each date to its records
+        """
+        index = {}
         for record in records:
-            if record.date == target_date:
-                return record
-        return None
+            index.setdefault(record.date, []).append(record)
+        return index
     
-    def _find_activity_for_date(self, records: List[ActivityRecord], target_date: date) -> Optional[ActivityRecord]:
+    def _find_nutrition_for_date(self, records_by_date: Dict[date, List[NutritionRecord]], target_date: date) -> Optional[NutritionRecord]:
+        """Find nutrition record for specific date."""
+        matching_records = records_by_date.get(target_date)
+        return matching_records[0] if matching_records else None
+    
+    def _find_activity_for_date(self, records_by_date: Dict[date, List[ActivityRecord]], target_date: date) -> Optional[ActivityRecord]:
         """Find activity record for specific date, prioritizing Oura over Whoop."""
-        matching_records = [record for record in records if record.date == target_date]
+        matching_records = records_by_date.get(target_date, [])
         
         if not matching_records:
             return None
@@ -99,14 +187,17 @@ class MacrosActivityAggregator:
         # Fallback to any matching record if no Oura data
         return matching_records[0]
     
-    def _find_weight_for_date(self, records: List[WeightRecord], target_date: date) -> Optional[WeightRecord]:
+    def _find_weight_for_date(self, records_by_date: Dict[date, List[WeightRecord]], target_date: date) -> Optional[WeightRecord]:
         """Find weight record for specific date (closest to date)."""
-        for record in records:
-            if record.date == target_date:
-                return record
-        return None
+        matching_records = records_by_date.get(target_date)
+        return matching_records[0] if matching_records else None
     
-    def _get_primary_sport(self, workout_records: List[WorkoutRecord], target_date: date) -> Optional[SportType]:
+    def _get_primary_sport(
+        self,
+        workout_records: List[WorkoutRecord],
+        workouts_by_date: Dict[date, List[WorkoutRecord]],
+        target_date: date
+    ) -> Optional[SportType]:
         """Get primary sport for the day using prioritization logic.
         
         Priority order:
@@ -116,6 +207,7 @@ class MacrosActivityAggregator:
         
         Args:
             workout_records: List of workout records
+            workouts_by_date: The same workout records grouped by date
             target_date: Date to find workouts for
             
         Returns:
@@ -133,7 +225,7 @@ class MacrosActivityAggregator:
         
         # Find workouts for target date - filter for Whoop workouts only
         self.logger.info(f"Target date: {target_date} (type: {type(target_date)})")
-        all_daily_workouts = [w for w in workout_records if w.date == target_date]
+        all_daily_workouts = workouts_by_date.get(target_date, [])
         self.logger.info(f"After date filtering: {len(all_daily_workouts)} workouts for {target_date}")
         
         daily_workouts = [
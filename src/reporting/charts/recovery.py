@@ -72,19 +72,14 @@ class RecoveryChartGenerator(ChartGenerator):
             zorder=3,
         )
 
-        # Add recovery score labels on top of each bar
-        for bar in bars:
-            height = bar.get_height()
-            ax1.annotate(
-                f"{height:.0f}",
-                xy=(bar.get_x() + bar.get_width() / 2, height),
-                xytext=(0, 3),
-                textcoords="offset points",
-                ha="center",
-                va="bottom",
-                color=AppConfig.REPORTING_COLORS["text"],
-                fontsize=AppConfig.REPORTING_STYLING["default_font_size"],
-            )
+        # Add recovery score labels on top of each bar (3pt above, centered)
+        ax1.bar_label(
+            bars,
+            fmt="%.0f",
+            padding=3,
+            color=AppConfig.REPORTING_COLORS["text"],
+            fontsize=AppConfig.REPORTING_STYLING["default_font_size"],
+        )
 
         # Add legend at the bottom left with rectangle patches to match nutrition chart
         recovery_legend = [
@@ -165,7 +165,7 @@ class APIClient:
 
         # Initialize API configuration
         self.base_url = base_url
-        self.token_manager = TokenManager(
+        self.token_manager = TokenManager.for_file(
             token_file or os.path.expanduser(default_token_path),
             validity_days=validity_days,
             refresh_buffer_hours=refresh_buffer_hours,
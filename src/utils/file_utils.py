@@ -117,3 +117,37 @@ def save_json_to_file(
         json.dump(data, f, indent=indent)
 
     return file_path
+
+
+def find_latest_file(
+    directory: str,
+    prefix: str = "",
+    suffix: str = "",
+) -> Optional[os.DirEntry]:
+    """Find the most recently modified file in a directory.
+
+    Lists the directory with a single os.scandir pass; each DirEntry caches
+    its stat result, so every file is stat'ed at most once.
+
+    Args:
+        directory: Directory to search
+        prefix: Required filename prefix (e.g., "health_report_")
+        suffix: Required filename suffix (e.g., ".md")
+
+    Returns:
+        DirEntry of the newest matching file, or None if the directory is
+        missing or nothing matches
+    """
+    try:
+        with os.scandir(directory) as entries:
+            matches = [
+                entry
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return None
+
+    return max(matches, key=lambda entry: entry.stat().st_mtime, default=None)
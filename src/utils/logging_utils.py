@@ -34,7 +34,20 @@ configure_logging()
 
 
 class HealthLogger:
-    """Logger for health data operations."""
+    """Logger for health data operations.
+
+    Instances are shared per logger name, so stages, aggregators and
+    persistence helpers constructed repeatedly reuse one HealthLogger
+    instead of re-resolving the logger and re-checking its handlers.
+    """
+
+    _instances: dict[str, "HealthLogger"] = {}
+
+    def __new__(cls, name: str):
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = cls._instances.setdefault(name, super().__new__(cls))
+        return instance
 
     def __init__(self, name: str):
         """Initialize logger.
@@ -42,6 +55,8 @@ class HealthLogger:
         Args:
             name: Logger name, typically module name
         """
+        if getattr(self, "logger", None) is not None:
+            return  # Shared instance already set up
         self.logger = logging.getLogger(name)
         self._setup_logger()
 
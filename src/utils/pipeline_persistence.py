@@ -1,13 +1,13 @@
 """Pipeline data persistence utilities for saving data at each stage."""
 
 import json
-import os
 from datetime import datetime
 from typing import Any, Dict, List, Union
 from pathlib import Path
 
 import pandas as pd
 
+from src.utils.file_utils import find_latest_file
 from src.utils.logging_utils import HealthLogger
 
 
@@ -172,24 +172,16 @@ class PipelinePersistence:
         """
         stage_dir = self.base_dir / stage
         
-        if not stage_dir.exists():
-            return None
-        
-        # Build pattern based on stage
+        # Build filename prefix/suffix based on stage
         if stage == "01_raw":
-            pattern = f"{service_name}_raw_*.json"
+            prefix, suffix = f"{service_name}_raw_", ".json"
         else:
             if data_type:
-                pattern = f"{service_name}_{data_type}_*.csv"
+                prefix, suffix = f"{service_name}_{data_type}_", ".csv"
             else:
-                pattern = f"{service_name}_*.csv"
-        
-        # Find matching files
-        matching_files = list(stage_dir.glob(pattern))
-        
-        if not matching_files:
-            return None
+                prefix, suffix = f"{service_name}_", ".csv"
         
-        # Return the most recent file
-        latest_file = max(matching_files, key=os.path.getmtime)
-        return str(latest_file)
+        # One scandir pass instead of a glob list plus a stat per candidate;
+        # a missing stage directory also yields None
+        latest_file = find_latest_file(stage_dir, prefix, suffix)
+        return latest_file.path if latest_file else None
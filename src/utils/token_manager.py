@@ -8,10 +8,16 @@ from typing import Any, Optional
 
 from src.utils.logging_utils import HealthLogger
 
+# Dedicated directory all token files are kept in
+TOKEN_DIR = os.path.join(os.path.expanduser("~"), ".health_analyzer_tokens")
+
 
 class TokenManager:
     """Singleton per token file path for managing OAuth tokens."""
 
+    # Shared instances keyed by their resolved token file path
+    _instances: dict[str, "TokenManager"] = {}
+
     # Default token validity period (90 days)
     DEFAULT_TOKEN_VALIDITY_DAYS = 90
 
@@ -52,7 +58,38 @@ class TokenManager:
         )
 
         self._load_tokens()
-        
+
+    @classmethod
+    def for_file(
+        cls,
+        token_file: str,
+        validity_days: int = None,
+        refresh_buffer_hours: int = None,
+    ) -> "TokenManager":
+        """Return the shared TokenManager for a token file, creating it once.
+
+        Clients using the same token file share one instance, so the file is
+        read (and migrated) once and a refresh by one client is seen by all.
+
+        Args:
+            token_file: Path to token storage file
+            validity_days: Number of days tokens are considered valid, used
+                only when the instance is first created
+            refresh_buffer_hours: Hours before expiration to trigger refresh,
+                used only when the instance is first created
+
+        Returns:
+            TokenManager for the resolved token file path
+        """
+        if token_file is None:
+            raise ValueError("token_file is required for TokenManager")
+        key = os.path.join(TOKEN_DIR, os.path.basename(os.path.expanduser(token_file)))
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(token_file, validity_days, refresh_buffer_hours)
+            cls._instances[key] = instance
+        return instance
+
     def _ensure_token_file_path(self, token_file: str) -> str:
         """Ensure the token file path exists with proper permissions.
         
@@ -69,7 +106,7 @@ class TokenManager:
         
         # Always use the dedicated token directory in user's home
         token_basename = os.path.basename(token_file)
-        new_token_dir = os.path.join(os.path.expanduser("~"), ".health_analyzer_tokens")
+        new_token_dir = TOKEN_DIR
         new_token_file = os.path.join(new_token_dir, token_basename)
         
         self.logger.debug(f"[TokenManager] Using dedicated token directory: {new_token_dir}")
@@ -89,7 +126,7 @@ class TokenManager:
             self.logger.debug(f"[TokenManager] Directory already exists: {new_token_dir}")
         
         # Check if there's an existing token file in the old location
-        if os.path.exists(token_file) and token_file != new_token_file:
+        if token_file != new_token_file and os.path.exists(token_file):
             try:
                 # Read the existing token file
                 with open(token_file, "r") as f: